@@ -1,13 +1,18 @@
+from functools import lru_cache
 from typing import Any, List, Tuple
 
-from pydantic import BaseSettings, Field
+from pydantic import BaseSettings, Field, validator
+
+DEFAULT_MODEL_ENDPOINTS: List[Tuple[str, str]] = [
+    ("llama3_8b", "http://llama3-8b:8001/generate"),
+    ("mistral_7b", "http://mistral-7b:8002/generate"),
+]
 
 
 class Settings(BaseSettings):
     """Runtime configuration for the CHAMP research engine."""
 
     symbol: str = Field(default="btcusdt", env="SYMBOL")
-    ws_binance: str = Field(default="", env="WS_BINANCE")
     batch_seconds: int = Field(default=30, env="BATCH_SEC")
     hist_points: int = Field(default=360, env="HIST_POINTS")
 
@@ -32,18 +37,28 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
 
-    def __init__(self, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
-        self.ws_binance = f"wss://stream.binance.com:9443/ws/{self.symbol}@trade"
-        if not self.model_endpoints:
-            self.model_endpoints = [
-                ("llama3_8b", "http://llama3-8b:8001/generate"),
-                ("mistral_7b", "http://mistral-7b:8002/generate"),
-            ]
+    @validator("model_endpoints", always=True)
+    def _default_model_endpoints(cls, value: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        return value or list(DEFAULT_MODEL_ENDPOINTS)
+
+    @property
+    def ws_binance(self) -> str:
+        return f"wss://stream.binance.com:9443/ws/{self.symbol}@trade"
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
     return Settings()
 
 
-settings = load_settings()
+class _LazySettings:
+    """Module-level proxy that defers building :class:`Settings` until first use."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(load_settings(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(load_settings(), name, value)
+
+
+settings: Settings = _LazySettings()  # type: ignore[assignment]
@@ -1,6 +1,8 @@
 import time
 from collections import deque
-from typing import Any, Deque, Dict, Tuple
+from typing import Any, Deque, Dict, Sequence, Tuple
+
+import numpy as np
 
 from config.settings import settings
 from ..llm.orchestrator import LLMOrchestrator, RoundContext
@@ -10,7 +12,43 @@ from ..storage.merkle_logger import MerkleLogger
 from ..streams.stream_manager import StreamManager
 
 
+class NumpyRingBuffer:
+    """Fixed-capacity ring buffer of float rows backed by a preallocated array."""
+
+    def __init__(self, capacity: int, width: int) -> None:
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive")
+        self.capacity = capacity
+        self.buf = np.empty((capacity, width), dtype=np.float64)
+        self.head = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, row: Sequence[float]) -> None:
+        self.buf[self.head % self.capacity] = row
+        self.head += 1
+        if self.count < self.capacity:
+            self.count += 1
+
+    def last(self) -> np.ndarray:
+        if not self.count:
+            raise IndexError("last() on empty ring buffer")
+        return self.buf[(self.head - 1) % self.capacity]
+
+    def view(self) -> np.ndarray:
+        """Return rows oldest-first; only a wrapped buffer is copied."""
+
+        start = (self.head - self.count) % self.capacity
+        if start + self.count <= self.capacity:
+            return self.buf[start : start + self.count]
+        return np.concatenate((self.buf[start:], self.buf[: self.head % self.capacity]))
+
+
 class CHAMPDashboard:
+    snapshot_ttl_seconds = 1.0
+
     def __init__(self) -> None:
         self.stream_manager = StreamManager()
         self.orchestrator = LLMOrchestrator()
@@ -18,9 +56,10 @@ class CHAMPDashboard:
         self.health_monitor = HealthMonitor(settings.metrics_port)
         self.merkle_logger = MerkleLogger(settings.data_root)
 
-        self.price_buffer: Deque[Tuple[float, float]] = deque(maxlen=settings.hist_points)
-        self.sol_buffer: Deque[Tuple[float, float, float]] = deque(maxlen=settings.hist_points)
+        self.price_buffer = NumpyRingBuffer(settings.hist_points, width=2)
+        self.sol_buffer = NumpyRingBuffer(settings.hist_points, width=3)
         self.latest_outputs: Deque[str] = deque(maxlen=10)
+        self._dash_snapshot: Tuple[float, Dict[str, Any]] = (0.0, {})
 
     async def initialize(self) -> None:
         await self.orchestrator.initialize()
@@ -41,29 +80,37 @@ class CHAMPDashboard:
 
         context = RoundContext(
             symbol=settings.symbol.upper(),
-            price=self.price_buffer[-1][1],
-            sol_tips_proxy=self.sol_buffer[-1][1],
-            sol_whales_proxy=self.sol_buffer[-1][2],
+            price=float(self.price_buffer.last()[1]),
+            sol_tips_proxy=float(self.sol_buffer.last()[1]),
+            sol_whales_proxy=float(self.sol_buffer.last()[2]),
             trending_source="https://arxiv.org/list/cs.AI/recent",
             timestamp=time.time(),
             round_id=f"round_{int(time.time())}",
         )
-        results = await self.orchestrator.execute_round(context)
+        results, top_index = await self.orchestrator.execute_round_with_top(context)
 
-        merkle_root = self.merkle_logger.log_round(context, results)
-        if results:
-            top_output = max(results, key=lambda x: len(x.get("text", "")))
-            self.latest_outputs.appendleft(top_output.get("text", ""))
+        merkle_root = await self.merkle_logger.log_round(context, results)
+        if top_index >= 0:
+            self.latest_outputs.appendleft(results[top_index]["text"])
+        self._dash_snapshot = (0.0, {})
         return merkle_root
 
     def get_dashboard_data(self) -> Dict[str, Any]:
-        return {
+        """Return dashboard state, reusing a snapshot younger than the TTL."""
+
+        now = time.monotonic()
+        taken_at, snapshot = self._dash_snapshot
+        if snapshot and now - taken_at < self.snapshot_ttl_seconds:
+            return snapshot
+        snapshot = {
             "system_health": self.health_monitor.health_check(),
             "research_kpis": self.research_kpis.get_signal_discovery_rate(),
             "ensemble_metrics": self.research_kpis.get_ensemble_metrics(),
             "stream_health": self.stream_manager.get_health_metrics(),
             "orchestrator_metrics": self.orchestrator.get_performance_metrics(),
             "latest_outputs": list(self.latest_outputs),
-            "price_data": list(self.price_buffer),
+            "price_data": self.price_buffer.view().tolist(),
             "merkle_root": self.merkle_logger.get_current_root(),
         }
+        self._dash_snapshot = (now, snapshot)
+        return snapshot
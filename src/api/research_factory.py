@@ -4,17 +4,57 @@ from __future__ import annotations
 import hashlib
 import json
 import math
-from dataclasses import dataclass
+import os
+import re
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional
-
-import pandas as pd
-import statsmodels.api as sm
-import requests
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import quote_plus
 
+import numpy as np
+
+from config.settings import settings
+
 RECENT_YEARS = 2  # window for "current recent"
+BATCH_FETCH_WORKERS = 8
+
+_QUERY_TOKEN_RE = re.compile(r"\w+")
+QUERY_STOPWORDS = frozenset(
+    {
+        "a", "an", "and", "are", "as", "at", "by", "for", "from",
+        "in", "is", "of", "on", "or", "the", "to", "with",
+    }
+)
+
+_CROSSREF_URL = (
+    "https://api.crossref.org/works?query={q}"
+    "&filter=from-pub-date:{y0}-01-01,until-pub-date:{y1}-12-31,type:journal-article"
+    "&sort=published&order=desc&rows={rows}"
+)
+_ARXIV_URL = (
+    "http://export.arxiv.org/api/query?search_query=all:{q}{window}"
+    "&start=0&max_results={rows}&sortBy=submittedDate&sortOrder=descending"
+)
+_SEMANTIC_SCHOLAR_URL = (
+    "https://api.semanticscholar.org/graph/v1/paper/search?query={q}"
+    "&limit={limit}&fields=title,year,authors,url,externalIds"
+)
+
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_ATOM_ENTRY = f"{_ATOM_NS}entry"
+_ATOM_TITLE = f"{_ATOM_NS}title"
+_ATOM_LINK = f"{_ATOM_NS}link"
+_ATOM_PUBLISHED = f"{_ATOM_NS}published"
+_ATOM_AUTHOR = f"{_ATOM_NS}author"
+_ATOM_NAME = f"{_ATOM_NS}name"
+_ATOM_ID = f"{_ATOM_NS}id"
+
+ReferenceFetcher = Callable[[str, int], List[Dict[str, Any]]]
 
 
 def _norm_authors(auth_list: Optional[Iterable[Any]]) -> str:
@@ -43,139 +83,261 @@ def _norm_authors(auth_list: Optional[Iterable[Any]]) -> str:
     return ", ".join(filter(None, names))
 
 
-def fetch_recent_papers(query: str, max_items: int = 3, timeout: int = 8) -> List[Dict[str, Any]]:
-    """Return up to ``max_items`` recent papers for the query with provenance."""
+_quote_query = lru_cache(maxsize=1024)(quote_plus)
 
-    results: List[Dict[str, Any]] = []
-    now = datetime.now(timezone.utc)
-    start_year = now.year - RECENT_YEARS
 
-    # ---------- Crossref ----------
+@lru_cache(maxsize=8)
+def _arxiv_date_window(start_year: int, end_year: int) -> str:
+    """Percent-encoded arXiv ``submittedDate`` clause appended to the query."""
+
+    return quote_plus(f" AND submittedDate:[{start_year}01010000 TO {end_year}12312359]")
+
+
+def _normalize_query(query: str) -> str:
+    """Canonical form used to treat reworded-but-equivalent queries as one.
+
+    Lower-cases, drops stop-words and sorts the remaining tokens so that
+    queries differing only in case, punctuation or word order collide.
+    """
+
+    tokens = sorted(
+        token for token in _QUERY_TOKEN_RE.findall(query.lower()) if token not in QUERY_STOPWORDS
+    )
+    return " ".join(tokens) or query.strip().lower()
+
+
+def _reference_cache_path(query: str, max_items: int, day: str) -> Path:
+    key = hashlib.sha256(f"{query}|{max_items}".encode("utf-8")).hexdigest()[:16]
+    return Path(settings.data_root) / "refs_cache" / day / f"{key}.json"
+
+
+def _prune_reference_days(day_dir: Path) -> None:
+    """Remove every cached day under ``refs_cache`` except ``day_dir``."""
+
     try:
-        cr_q = quote_plus(query)
-        url = (
-            "https://api.crossref.org/works?query="
-            f"{cr_q}&filter=from-pub-date:{start_year}-01-01,until-pub-date:{now.year}-12-31,type:journal-article"
-            f"&sort=published&order=desc&rows={max_items * 2}"
-        )
-        response = requests.get(url, timeout=timeout)
-        if response.ok:
-            payload = response.json().get("message", {})
-            for item in payload.get("items", []):
-                title = " ".join(item.get("title", [])).strip() or "Untitled"
-                doi = item.get("DOI")
-                link = f"https://doi.org/{doi}" if doi else (item.get("URL") or "")
-                year: Optional[int] = None
-                for key in ("published-print", "published-online", "issued"):
-                    if item.get(key, {}).get("date-parts"):
-                        try:
-                            year = int(item[key]["date-parts"][0][0])
-                            break
-                        except (TypeError, ValueError, IndexError):
-                            continue
-                authors = _norm_authors(item.get("author"))
-                results.append(
-                    {
-                        "title": title,
-                        "year": year,
-                        "authors": authors,
-                        "link": link,
-                        "provider": "Crossref",
-                        "source_id": doi or link,
-                        "accessed": now.isoformat(),
-                    }
-                )
-    except Exception:
-        pass
+        stale = [entry for entry in day_dir.parent.iterdir() if entry != day_dir]
+    except OSError:
+        return
+    for entry in stale:
+        if entry.is_dir():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+
 
-    # ---------- arXiv ----------
+def _read_json_cache(path: Path) -> Any:
     try:
-        arxiv_q = quote_plus(
-            f"{query} AND submittedDate:[{start_year}01010000 TO {now.year}12312359]"
-        )
-        url = (
-            "http://export.arxiv.org/api/query?search_query=all:"
-            f"{arxiv_q}&start=0&max_results={max_items * 2}&sortBy=submittedDate&sortOrder=descending"
-        )
-        response = requests.get(url, timeout=timeout)
-        if response.ok:
-            import xml.etree.ElementTree as ET
-
-            root = ET.fromstring(response.text)
-            ns = {"a": "http://www.w3.org/2005/Atom"}
-            for entry in root.findall("a:entry", ns):
-                title = (
-                    entry.findtext("a:title", default="", namespaces=ns) or ""
-                ).strip().replace("\n", " ")
-                link = ""
-                for link_entry in entry.findall("a:link", ns):
-                    if link_entry.attrib.get("type") == "text/html":
-                        link = link_entry.attrib.get("href", "")
-                year: Optional[int] = None
-                published = entry.findtext("a:published", default="", namespaces=ns)
-                if published:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json_cache(path: Path, payload: Any) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # The cache is an optimisation; an unwritable data root is not fatal.
+
+
+def fetch_recent_papers(query: str, max_items: int = 3, timeout: int = 8) -> List[Dict[str, Any]]:
+    """Return up to ``max_items`` recent papers for the query with provenance.
+
+    Results are memoized on disk under ``settings.data_root/refs_cache/<UTC day>``
+    per ``(query, max_items)`` so repeated hypotheses skip the provider
+    round-trips until the next day; the first write of a day removes the
+    directories of earlier days.  Empty results are never cached.
+    """
+
+    day = datetime.now(timezone.utc).date().isoformat()
+    cache_path = _reference_cache_path(_normalize_query(query), max_items, day)
+    cached = _read_json_cache(cache_path)
+    if isinstance(cached, list):
+        return cached
+    references = _fetch_recent_papers_uncached(query, max_items, timeout)
+    if references:
+        if not cache_path.parent.is_dir():
+            _prune_reference_days(cache_path.parent)
+        _write_json_cache(cache_path, references)
+    return references
+
+
+@lru_cache(maxsize=1)
+def _http_session() -> Any:
+    """Return the process-wide pooled session shared by the provider fetchers.
+
+    Reusing it keeps TCP/TLS connections to Crossref, arXiv and Semantic
+    Scholar alive across queries; the pool is sized for the batch workers.
+    """
+
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=BATCH_FETCH_WORKERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _fetch_crossref(
+    quoted_query: str, max_items: int, timeout: int, now: datetime
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    url = _CROSSREF_URL.format(
+        q=quoted_query, y0=now.year - RECENT_YEARS, y1=now.year, rows=max_items * 2
+    )
+    response = _http_session().get(url, timeout=timeout)
+    if response.ok:
+        payload = response.json().get("message", {})
+        for item in payload.get("items", []):
+            title = " ".join(item.get("title", [])).strip() or "Untitled"
+            doi = item.get("DOI")
+            link = f"https://doi.org/{doi}" if doi else (item.get("URL") or "")
+            year: Optional[int] = None
+            for key in ("published-print", "published-online", "issued"):
+                if item.get(key, {}).get("date-parts"):
                     try:
-                        year = int(published[:4])
-                    except (TypeError, ValueError):
-                        year = None
-                authors = ", ".join(
-                    [
-                        author.findtext("a:name", default="", namespaces=ns)
-                        for author in entry.findall("a:author", ns)
-                    ]
-                )
-                arxiv_id = (
-                    entry.findtext("a:id", default="", namespaces=ns) or ""
-                ).split("/")[-1]
-                results.append(
-                    {
-                        "title": title or "Untitled",
-                        "year": year,
-                        "authors": authors,
-                        "link": link or f"https://arxiv.org/abs/{arxiv_id}",
-                        "provider": "arXiv",
-                        "source_id": arxiv_id,
-                        "accessed": now.isoformat(),
-                    }
-                )
-    except Exception:
-        pass
+                        year = int(item[key]["date-parts"][0][0])
+                        break
+                    except (TypeError, ValueError, IndexError):
+                        continue
+            authors = _norm_authors(item.get("author"))
+            results.append(
+                {
+                    "title": title,
+                    "year": year,
+                    "authors": authors,
+                    "link": link,
+                    "provider": "Crossref",
+                    "source_id": doi or link,
+                    "accessed": now.isoformat(),
+                }
+            )
+    return results
 
-    # ---------- Semantic Scholar (fallback) ----------
-    if len(results) < max_items:
-        try:
-            ss_q = quote_plus(query)
-            url = (
-                "https://api.semanticscholar.org/graph/v1/paper/search?query="
-                f"{ss_q}&limit={max_items}&fields=title,year,authors,url,externalIds"
+
+def _fetch_arxiv(
+    quoted_query: str, max_items: int, timeout: int, now: datetime
+) -> List[Dict[str, Any]]:
+    import xml.etree.ElementTree as ET
+
+    results: List[Dict[str, Any]] = []
+    url = _ARXIV_URL.format(
+        q=quoted_query,
+        window=_arxiv_date_window(now.year - RECENT_YEARS, now.year),
+        rows=max_items * 2,
+    )
+    response = _http_session().get(url, timeout=timeout, stream=True)
+    try:
+        if not response.ok:
+            return results
+        response.raw.decode_content = True
+        feed = None
+        for event, entry in ET.iterparse(response.raw, events=("start", "end")):
+            if feed is None:
+                feed = entry
+            if event != "end" or entry.tag != _ATOM_ENTRY:
+                continue
+            title = (entry.findtext(_ATOM_TITLE, default="") or "").strip().replace("\n", " ")
+            link = ""
+            for link_entry in entry.iter(_ATOM_LINK):
+                if link_entry.attrib.get("type") == "text/html":
+                    link = link_entry.attrib.get("href", "")
+            year: Optional[int] = None
+            published = entry.findtext(_ATOM_PUBLISHED, default="")
+            if published:
+                try:
+                    year = int(published[:4])
+                except (TypeError, ValueError):
+                    year = None
+            authors = ", ".join(
+                author.findtext(_ATOM_NAME, default="") for author in entry.iter(_ATOM_AUTHOR)
+            )
+            arxiv_id = (entry.findtext(_ATOM_ID, default="") or "").split("/")[-1]
+            # Detach finished entries from the feed root as well, so memory
+            # stays bounded by a single entry rather than by the feed length.
+            feed.clear()
+            results.append(
+                {
+                    "title": title or "Untitled",
+                    "year": year,
+                    "authors": authors,
+                    "link": link or f"https://arxiv.org/abs/{arxiv_id}",
+                    "provider": "arXiv",
+                    "source_id": arxiv_id,
+                    "accessed": now.isoformat(),
+                }
             )
-            response = requests.get(url, timeout=timeout)
-            if response.ok:
-                data = response.json().get("data", [])
-                for item in data:
-                    author_records = item.get("authors", [])
-                    authors = _norm_authors(
-                        [{"given": author.get("name", "")} for author in author_records]
-                    )
-                    link = item.get("url") or ""
-                    doi = ""
-                    external_ids = item.get("externalIds") or {}
-                    if isinstance(external_ids, dict) and external_ids.get("DOI"):
-                        doi = external_ids["DOI"]
-                        link = f"https://doi.org/{doi}"
-                    results.append(
-                        {
-                            "title": item.get("title", "Untitled"),
-                            "year": item.get("year"),
-                            "authors": authors,
-                            "link": link,
-                            "provider": "Semantic Scholar",
-                            "source_id": doi or link,
-                            "accessed": now.isoformat(),
-                        }
-                    )
-        except Exception:
-            pass
+            if len(results) >= max_items * 2:
+                break
+    finally:
+        response.close()
+    return results
+
+
+def _fetch_semantic_scholar(
+    quoted_query: str, max_items: int, timeout: int, now: datetime
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    url = _SEMANTIC_SCHOLAR_URL.format(q=quoted_query, limit=max_items)
+    response = _http_session().get(url, timeout=timeout)
+    if response.ok:
+        data = response.json().get("data", [])
+        for item in data:
+            author_records = item.get("authors", [])
+            authors = _norm_authors(
+                [{"given": author.get("name", "")} for author in author_records]
+            )
+            link = item.get("url") or ""
+            doi = ""
+            external_ids = item.get("externalIds") or {}
+            if isinstance(external_ids, dict) and external_ids.get("DOI"):
+                doi = external_ids["DOI"]
+                link = f"https://doi.org/{doi}"
+            results.append(
+                {
+                    "title": item.get("title", "Untitled"),
+                    "year": item.get("year"),
+                    "authors": authors,
+                    "link": link,
+                    "provider": "Semantic Scholar",
+                    "source_id": doi or link,
+                    "accessed": now.isoformat(),
+                }
+            )
+    return results
+
+
+# Provider order doubles as result priority: Semantic Scholar is the fallback
+# and only survives the final trim when the others come up short.
+_PROVIDER_FETCHERS = (_fetch_crossref, _fetch_arxiv, _fetch_semantic_scholar)
+
+
+def _fetch_recent_papers_uncached(
+    query: str, max_items: int, timeout: int
+) -> List[Dict[str, Any]]:
+    now = datetime.now(timezone.utc)
+    quoted_query = _quote_query(query)
+
+    # The providers are independent, so query them concurrently and pay
+    # roughly the slowest round-trip instead of the sum of all three.
+    results: List[Dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=len(_PROVIDER_FETCHERS)) as pool:
+        futures = [
+            pool.submit(provider, quoted_query, max_items, timeout, now)
+            for provider in _PROVIDER_FETCHERS
+        ]
+        for future in futures:
+            try:
+                results.extend(future.result())
+            except Exception:
+                continue
 
     # de-duplicate by link/source_id, keep order
     seen: set[str] = set()
@@ -188,7 +350,56 @@ def fetch_recent_papers(query: str, max_items: int = 3, timeout: int = 8) -> Lis
     return deduped[:max_items]
 
 
-@dataclass
+def fetch_recent_papers_batch(
+    queries: Iterable[str],
+    max_items: int = 3,
+    fetcher: Optional[ReferenceFetcher] = None,
+    max_workers: int = BATCH_FETCH_WORKERS,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch references for many queries concurrently, keyed by query.
+
+    Queries sharing a :func:`_normalize_query` form are fetched once, using
+    the first such query, and the result is shared with the others.
+    ``fetcher`` defaults to :func:`fetch_recent_papers`; each call is I/O
+    bound so a thread pool collapses ``N`` sequential round-trips into
+    roughly one.
+    """
+
+    fetch = fetcher or fetch_recent_papers
+    normalized = {query: _normalize_query(query) for query in queries}
+    if not normalized:
+        return {}
+    representatives: Dict[str, str] = {}
+    for query, form in normalized.items():
+        representatives.setdefault(form, query)
+    forms = list(representatives)
+    if len(forms) == 1:
+        fetched_by_form = {forms[0]: fetch(representatives[forms[0]], max_items=max_items)}
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(forms))) as pool:
+            fetched = pool.map(
+                lambda form: fetch(representatives[form], max_items=max_items), forms
+            )
+            fetched_by_form = dict(zip(forms, fetched))
+    return {query: list(fetched_by_form[form]) for query, form in normalized.items()}
+
+
+def _metric_value(metrics: Dict[str, Any], key: str) -> float:
+    """Return a metric as a float, using NaN when it is missing or null."""
+
+    value = metrics.get(key)
+    return float("nan") if value is None else float(value)
+
+
+def _markdown_reference_line(ref: Dict[str, Any]) -> str:
+    year = f" ({ref.get('year')})" if ref.get("year") else ""
+    return (
+        f"- [{ref.get('title', 'Untitled')}]({ref.get('link', '')})"
+        f"{year} — {ref.get('authors', '')} · _{ref.get('provider', '')}_"
+    )
+
+
+@dataclass(frozen=True)
 class RegressionSummary:
     effect_size: float
     p_value: float
@@ -197,43 +408,109 @@ class RegressionSummary:
     sample_size: int
 
 
+def _dataset_key(path: Path) -> Tuple[str, int, int]:
+    """Identify a dataset revision by path, modification time and size."""
+
+    stat = os.stat(path)
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=4)
+def _read_dataset(path: str, mtime_ns: int, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse the dataset once into read-only ``(wt, mpg)`` float64 columns."""
+
+    del mtime_ns, size  # Cache key only; a changed file yields a new entry.
+    import pandas as pd
+
+    df = pd.read_csv(path)
+    required_columns = {"wt", "mpg"}
+    missing = required_columns.difference(df.columns)
+    if missing:
+        raise ValueError(f"Dataset at {path} missing columns: {sorted(missing)}")
+    columns = []
+    for name in ("wt", "mpg"):
+        column = np.array(df[name], dtype=np.float64)
+        column.setflags(write=False)
+        columns.append(column)
+    return columns[0], columns[1]
+
+
+@lru_cache(maxsize=4)
+def _fit_regression(path: str, mtime_ns: int, size: int) -> RegressionSummary:
+    """Return the regression for a dataset revision, persisted across restarts.
+
+    The on-disk entry under ``settings.data_root/reg_cache`` is keyed by the
+    dataset's content hash, so a cold process only pays for a small JSON read
+    while the in-memory LRU keeps the hot path free of any I/O.
+    """
+
+    fingerprint = hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+    cache_path = Path(settings.data_root) / "reg_cache" / f"{fingerprint}.json"
+    cached = _read_json_cache(cache_path)
+    if isinstance(cached, dict):
+        try:
+            return RegressionSummary(**cached)
+        except TypeError:
+            pass  # Stale schema; fall through and refit.
+    summary = _compute_regression(path, mtime_ns, size)
+    _write_json_cache(cache_path, asdict(summary))
+    return summary
+
+
+def _compute_regression(path: str, mtime_ns: int, size: int) -> RegressionSummary:
+    """Closed-form univariate OLS of ``mpg`` on ``wt`` with a two-sided t-test."""
+
+    from scipy import stats
+
+    x, y = _read_dataset(path, mtime_ns, size)
+    n = x.size
+    x_centred = x - x.mean()
+    y_centred = y - y.mean()
+    sxx = float(x_centred @ x_centred)
+    if n <= 2 or sxx == 0.0:
+        # No residual degrees of freedom or no spread in ``wt``: the slope
+        # and its test are undefined, so report NaN rather than raising.
+        return RegressionSummary(
+            effect_size=math.nan,
+            p_value=math.nan,
+            intercept=float(y.mean()) if n else math.nan,
+            r_squared=math.nan,
+            sample_size=int(n),
+        )
+    slope = float(x_centred @ y_centred) / sxx
+    intercept = float(y.mean()) - slope * float(x.mean())
+    residuals = y_centred - slope * x_centred
+    rss = float(residuals @ residuals)
+    dof = n - 2
+    t_stat = slope / math.sqrt(rss / dof / sxx)
+    return RegressionSummary(
+        effect_size=slope,
+        p_value=float(2 * stats.t.sf(abs(t_stat), df=dof)),
+        intercept=intercept,
+        r_squared=1.0 - rss / float(y_centred @ y_centred),
+        sample_size=int(n),
+    )
+
+
 class ResearchFactory:
     """Generate research outputs backed by real regression analysis."""
 
     def __init__(
         self,
         dataset_path: Optional[Path] = None,
-        reference_fetcher: Optional[Callable[[str, int], List[Dict[str, Any]]]] = None,
+        reference_fetcher: Optional[ReferenceFetcher] = None,
     ) -> None:
         default_path = Path(__file__).resolve().parents[2] / "data" / "real_experiment.csv"
         self.dataset_path = dataset_path or default_path
         self.reference_fetcher = reference_fetcher or fetch_recent_papers
-        self._dataset_cache: Optional[pd.DataFrame] = None
-
-    def _load_dataset(self) -> pd.DataFrame:
-        if self._dataset_cache is None:
-            df = pd.read_csv(self.dataset_path)
-            required_columns = {"wt", "mpg"}
-            missing = required_columns.difference(df.columns)
-            if missing:
-                raise ValueError(
-                    f"Dataset at {self.dataset_path} missing columns: {sorted(missing)}"
-                )
-            self._dataset_cache = df.astype(float)
-        return self._dataset_cache.copy()
+
+    def _load_dataset(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the shared, memoized read-only ``(wt, mpg)`` columns."""
+
+        return _read_dataset(*_dataset_key(self.dataset_path))
 
     def _run_regression(self) -> RegressionSummary:
-        df = self._load_dataset()
-        X = sm.add_constant(df["wt"], has_constant="add")
-        model = sm.OLS(df["mpg"], X)
-        fit = model.fit()
-        return RegressionSummary(
-            effect_size=float(fit.params["wt"]),
-            p_value=float(fit.pvalues["wt"]),
-            intercept=float(fit.params["const"]),
-            r_squared=float(fit.rsquared),
-            sample_size=int(fit.nobs),
-        )
+        return _fit_regression(*_dataset_key(self.dataset_path))
 
     def _verify_regression(self, baseline: RegressionSummary) -> Dict[str, Any]:
         rerun = self._run_regression()
@@ -245,8 +522,8 @@ class ResearchFactory:
         )
         return {
             "replicated": effect_match and p_match,
-            "baseline": baseline.__dict__,
-            "recomputed": rerun.__dict__,
+            "baseline": asdict(baseline),
+            "recomputed": asdict(rerun),
         }
 
     def _build_analysis_summary(self, summary: RegressionSummary) -> str:
@@ -263,11 +540,15 @@ class ResearchFactory:
         baseline = self._run_regression()
         verification = self._verify_regression(baseline)
         timestamp = datetime.now(timezone.utc).isoformat()
+        hypotheses = list(hypotheses)
+        references_by_hypothesis = fetch_recent_papers_batch(
+            hypotheses, max_items=3, fetcher=self.reference_fetcher
+        )
 
         papers: List[Dict[str, Any]] = []
         for hypothesis in hypotheses:
-            paper_id = hashlib.sha256(hypothesis.encode("utf-8")).hexdigest()[:16]
-            references = self.reference_fetcher(hypothesis, max_items=3)
+            paper_id = hashlib.blake2b(hypothesis.encode("utf-8"), digest_size=8).hexdigest()
+            references = references_by_hypothesis[hypothesis]
             paper = {
                 "id": paper_id,
                 "title": hypothesis,
@@ -294,42 +575,66 @@ class ResearchFactory:
 
         return papers
 
-    def build_markdown_export(self, papers: Iterable[Dict[str, Any]]) -> str:
-        md_parts: List[str] = []
+    @staticmethod
+    def build_markdown_export(papers: Iterable[Dict[str, Any]]) -> str:
+        paper_blocks: List[str] = []
         for paper in papers:
-            md_parts.append(f"## {paper.get('title', 'Untitled')}")
-            md_parts.append("")
-            md_parts.append(f"**Hypothesis:** {paper.get('hypothesis', '')}")
-            md_parts.append("")
-            md_parts.append(paper.get("analysis", ""))
-            md_parts.append("")
+            sections = [
+                f"## {paper.get('title', 'Untitled')}",
+                f"**Hypothesis:** {paper.get('hypothesis', '')}",
+                paper.get("analysis", ""),
+            ]
             metrics = paper.get("metrics", {})
             if metrics:
-                md_parts.append("**Key Metrics:**")
-                md_parts.append(
-                    (
-                        f"- Effect size: {metrics.get('effect_size'):.6f}\n"
-                        f"- p-value: {metrics.get('p_value'):.6e}\n"
-                        f"- R^2: {metrics.get('r_squared'):.4f}\n"
-                        f"- Sample size: {metrics.get('sample_size')}"
-                    )
+                sections.append(
+                    "**Key Metrics:**\n"
+                    f"- Effect size: {_metric_value(metrics, 'effect_size'):.6f}\n"
+                    f"- p-value: {_metric_value(metrics, 'p_value'):.6e}\n"
+                    f"- R^2: {_metric_value(metrics, 'r_squared'):.4f}\n"
+                    f"- Sample size: {metrics.get('sample_size')}"
                 )
-                md_parts.append("")
             if paper.get("references"):
-                md_parts.append("**References:**")
-                for ref in paper["references"]:
-                    year = f" ({ref.get('year')})" if ref.get("year") else ""
-                    md_parts.append(
-                        f"- [{ref.get('title', 'Untitled')}]({ref.get('link', '')})"
-                        f"{year} — {ref.get('authors', '')} · _{ref.get('provider', '')}_"
-                    )
-                md_parts.append("")
-        return "\n".join(md_parts).strip()
-
-    def build_json_export(self, papers: Iterable[Dict[str, Any]]) -> str:
+                reference_lines = "\n".join(
+                    _markdown_reference_line(ref) for ref in paper["references"]
+                )
+                sections.append(f"**References:**\n{reference_lines}")
+            paper_blocks.append("\n\n".join(sections))
+        return "\n\n".join(paper_blocks).strip()
+
+    @staticmethod
+    def build_json_export(papers: Iterable[Dict[str, Any]]) -> str:
         return json.dumps(list(papers), indent=2)
 
 
+_EXPORT_CACHE_SIZE = 8
+_export_cache: "OrderedDict[Tuple[Tuple[Any, Any], ...], Tuple[str, str]]" = OrderedDict()
+
+
+def _exports_for(papers: List[Dict[str, Any]]) -> Tuple[str, str]:
+    """Return ``(markdown, json)`` exports, rendered once per generated batch.
+
+    Batches are keyed on each paper's ``(id, created_at)`` pair, which
+    ``generate_research_with_verification`` stamps per batch, so a rerun
+    with the same papers is a dict lookup. Papers without an id are
+    rendered every time.
+    """
+
+    key = tuple((paper.get("id"), paper.get("created_at")) for paper in papers)
+    cacheable = all(paper_id is not None for paper_id, _ in key)
+    if cacheable and key in _export_cache:
+        _export_cache.move_to_end(key)
+        return _export_cache[key]
+    exports = (
+        ResearchFactory.build_markdown_export(papers),
+        ResearchFactory.build_json_export(papers),
+    )
+    if cacheable:
+        _export_cache[key] = exports
+        if len(_export_cache) > _EXPORT_CACHE_SIZE:
+            _export_cache.popitem(last=False)
+    return exports
+
+
 def render_research_card(paper: Dict[str, Any], st_module: Any = None) -> None:
     """Render a research card in Streamlit with references if available."""
 
@@ -410,9 +715,9 @@ def render_export_tab(papers: Iterable[Dict[str, Any]], st_module: Any = None) -
         except ImportError as exc:  # pragma: no cover - UI dependency optional
             raise RuntimeError("Streamlit is required for UI rendering") from exc
 
-    factory = ResearchFactory()
-    markdown_export = factory.build_markdown_export(papers)
-    json_export = factory.build_json_export(papers)
+    # Streamlit reruns this on every widget interaction; unchanged batches
+    # reuse their rendered exports.
+    markdown_export, json_export = _exports_for(list(papers))
 
     st.download_button(
         "Download Markdown",
@@ -1,16 +1,33 @@
+import math
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Tuple
 
 import numpy as np
 
 
-def rolling_sharpe(returns: Iterable[float]) -> float:
-    data = np.array(list(returns), dtype=float)
-    if data.size == 0:
-        return 0.0
+def _as_returns_array(returns: Iterable[float]) -> np.ndarray:
+    if isinstance(returns, (np.ndarray, list, tuple)):
+        return np.asarray(returns, dtype=np.float64).reshape(-1)
+    return np.fromiter(returns, dtype=np.float64)
+
+
+def _sharpe_and_volatility(data: np.ndarray) -> Tuple[float, float]:
+    """Return ``(sharpe, sample_std)`` sharing one mean between both statistics.
+
+    Two vectorised passes: the mean, then the centred sum of squares as a dot
+    product. ``build_report`` gets both values from this one call.
+    """
+
+    if data.size < 2:
+        return 0.0, 0.0
     mean = float(data.mean())
-    std = float(data.std(ddof=1)) if data.size > 1 else 0.0
-    return mean / std if std else 0.0
+    centred = data - mean
+    std = math.sqrt(float(centred @ centred) / (data.size - 1))
+    return (mean / std if std else 0.0), std
+
+
+def rolling_sharpe(returns: Iterable[float]) -> float:
+    return _sharpe_and_volatility(_as_returns_array(returns))[0]
 
 
 @dataclass
@@ -20,6 +37,5 @@ class EconometricsReport:
 
 
 def build_report(returns: Iterable[float]) -> EconometricsReport:
-    data = np.array(list(returns), dtype=float)
-    volatility = float(data.std(ddof=1)) if data.size > 1 else 0.0
-    return EconometricsReport(sharpe=rolling_sharpe(data), volatility=volatility)
+    sharpe, volatility = _sharpe_and_volatility(_as_returns_array(returns))
+    return EconometricsReport(sharpe=sharpe, volatility=volatility)
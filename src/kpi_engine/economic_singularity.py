@@ -7,25 +7,40 @@ into per-capita series, growth rates, and anomaly detection that can be
 used by the wider KPI engine.  No stochastic simulation or mocked
 deployments are performed here – the functions operate purely on the
 records provided by the caller.
-"""Economic singularity wealth engine utilities.
 
-This module provides a light-weight implementation of the "zero budget"
+The module also hosts a light-weight implementation of the "zero budget"
 wealth engine that appeared in the research brief.  The goal is to keep the
 logic deterministic and well structured so that it can be unit-tested and
-integrated with the rest of the KPI stack.
+integrated with the rest of the KPI stack.  Its internal arithmetic is
+float64; Decimal is only used where a caller opts into it for presentation
+or audit (``high_precision`` / ``precise`` flags).
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict, Iterable, List, Sequence, Tuple
+from array import array
+import asyncio
+from collections import defaultdict
+from collections.abc import Mapping as MappingABC, Sequence as SequenceABC
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from decimal import Decimal, ROUND_FLOOR, ROUND_HALF_UP
+from enum import Enum
+from functools import lru_cache
+import hashlib
+import random
+import re
+import time
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 
 DecimalType = Decimal  # Alias retained for clarity in type signatures.
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GDPRecord:
     """Single observation of a country's GDP and population."""
 
@@ -33,34 +48,204 @@ class GDPRecord:
     year: int
     gdp_usd: Decimal
     population: int
+    # GDP as an exact integer number of cents; ``None`` when it has sub-cent digits.
+    gdp_cents: Optional[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        scaled = Decimal(self.gdp_usd).scaleb(2)
+        exact = scaled.is_finite() and scaled == scaled.to_integral_value()
+        object.__setattr__(self, "gdp_cents", int(scaled) if exact else None)
+
+    def gdp_per_capita_cents(self) -> int:
+        """Return GDP per capita in whole cents, rounded half-up."""
+
+        if self.population <= 0:
+            raise ValueError("Population must be positive to compute GDP per capita")
+        if self.gdp_cents is None:
+            return int(self.gdp_per_capita().scaleb(2))
+        magnitude = (2 * abs(self.gdp_cents) + self.population) // (2 * self.population)
+        return -magnitude if self.gdp_cents < 0 else magnitude
 
     def gdp_per_capita(self) -> DecimalType:
         """Return GDP per capita rounded to two decimals."""
 
         if self.population <= 0:
             raise ValueError("Population must be positive to compute GDP per capita")
+        if self.gdp_cents is not None:
+            return Decimal(self.gdp_per_capita_cents()).scaleb(-2)
         value = self.gdp_usd / Decimal(self.population)
         return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
 
+# Bound keeping ``2 * cents + population`` inside int64 for the vector kernel.
+_INT_CENTS_LIMIT = 2**60
+
+
+def _int64_cents(record: GDPRecord) -> int:
+    """Return the record's GDP cents, or -1 when the int64 kernel can't hold it."""
+
+    cents = record.gdp_cents
+    if cents is not None and 0 <= cents < _INT_CENTS_LIMIT:
+        return cents
+    return -1
+
+
 class GDPPerCapitaDataset:
-    """Collection of :class:`GDPRecord` grouped by country."""
+    """Collection of :class:`GDPRecord` grouped by country.
+
+    Alongside the record tuples, each country keeps aligned NumPy columns
+    (``years``, GDP and population) so per-capita metrics can be computed as
+    vector operations instead of per-record Decimal division.
+    """
 
     def __init__(self, records: Iterable[GDPRecord]):
-        self._records: Dict[str, List[GDPRecord]] = {}
+        grouped: Dict[str, List[GDPRecord]] = defaultdict(list)
         for record in records:
-            country_records = self._records.setdefault(record.country, [])
-            country_records.append(record)
-        for country in self._records:
-            self._records[country].sort(key=lambda item: item.year)
+            grouped[record.country].append(record)
+        self._records: Dict[str, Tuple[GDPRecord, ...]] = {}
+        self._years: Dict[str, np.ndarray] = {}
+        self._gdp: Dict[str, np.ndarray] = {}
+        self._population: Dict[str, np.ndarray] = {}
+        self._gdp_cents: Dict[str, np.ndarray] = {}
+        self._per_capita_cents: Dict[str, np.ndarray] = {}
+        for country, country_records in grouped.items():
+            count = len(country_records)
+            years = np.fromiter(
+                (r.year for r in country_records), dtype=np.int64, count=count
+            )
+            # One stable numeric argsort orders every column (ties keep
+            # insertion order, as list.sort did).
+            order = np.argsort(years, kind="stable")
+            ordered = tuple(country_records[index] for index in order.tolist())
+            self._records[country] = ordered
+            self._years[country] = years[order]
+            self._gdp[country] = np.fromiter(
+                (float(r.gdp_usd) for r in ordered), dtype=np.float64, count=count
+            )
+            self._population[country] = np.fromiter(
+                (r.population for r in ordered), dtype=np.int64, count=count
+            )
+            self._gdp_cents[country] = np.fromiter(
+                (_int64_cents(r) for r in ordered),
+                dtype=np.int64,
+                count=count,
+            )
+            # Columns are shared with callers and caches, so freeze them.
+            for column in (self._years, self._gdp, self._population, self._gdp_cents):
+                column[country].setflags(write=False)
+        self._countries = tuple(sorted(self._records))
 
     def countries(self) -> Sequence[str]:
-        return tuple(sorted(self._records))
+        return self._countries
 
     def records_for(self, country: str) -> Sequence[GDPRecord]:
+        # Stored as tuples after sorting, so callers can share them safely.
+        self._require(country)
+        return self._records[country]
+
+    def years(self, country: str) -> np.ndarray:
+        self._require(country)
+        return self._years[country]
+
+    def per_capita_array(self, country: str) -> np.ndarray:
+        """Return unrounded GDP per capita as a float64 vector."""
+
+        self._require(country)
+        population = self._population[country]
+        if (population <= 0).any():
+            raise ValueError("Population must be positive to compute GDP per capita")
+        return self._gdp[country] / population
+
+    def per_capita_cents(self, country: str) -> np.ndarray:
+        """Return GDP per capita in whole cents, rounded half-up like Decimal.
+
+        GDP is held as integer cents, so ``(2 * gdp + pop) // (2 * pop)`` is
+        an exact vectorised ``ROUND_HALF_UP``.  Records with fractional cents,
+        negative GDP or out-of-range magnitudes fall back to
+        :meth:`GDPRecord.gdp_per_capita`.
+        """
+
+        cached = self._per_capita_cents.get(country)
+        if cached is not None:
+            return cached
+        self._require(country)
+        population = self._population[country]
+        if (population <= 0).any():
+            raise ValueError("Population must be positive to compute GDP per capita")
+        gdp_cents = self._gdp_cents[country]
+        fallback = np.flatnonzero((gdp_cents < 0) | (population >= _INT_CENTS_LIMIT))
+        cents = (2 * gdp_cents + population) // (2 * population)
+        if fallback.size:
+            # Out-of-range rows may not fit int64, so keep Python ints.
+            cents = cents.astype(object)
+            records = self._records[country]
+            for index in fallback.tolist():
+                cents[index] = records[index].gdp_per_capita_cents()
+        cents.setflags(write=False)
+        self._per_capita_cents[country] = cents
+        return cents
+
+    def _require(self, country: str) -> None:
         if country not in self._records:
             raise KeyError(f"No GDP records available for country '{country}'")
-        return tuple(self._records[country])
+
+
+def _round_half_up_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Integer ``numerator / denominator`` rounded half away from zero."""
+
+    magnitude = (2 * abs(numerator) + abs(denominator)) // (2 * abs(denominator))
+    return np.where((numerator < 0) != (denominator < 0), -magnitude, magnitude)
+
+
+# Above this many cents, ``delta * 10_000`` could overflow int64.
+_GROWTH_INT64_LIMIT = 2**44
+
+
+def _growth_basis_points(cents: np.ndarray) -> np.ndarray:
+    """Year-over-year growth of a cents series in basis points (half-up)."""
+
+    if cents.dtype != object and np.abs(cents).max() >= _GROWTH_INT64_LIMIT:
+        cents = cents.astype(object)
+    previous = cents[:-1]
+    if (previous == 0).any():
+        raise ZeroDivisionError(
+            "Cannot compute growth rate when previous per capita value is zero"
+        )
+    return _round_half_up_ratio((cents[1:] - previous) * 10000, previous)
+
+
+def _scaled_pairs(
+    years: np.ndarray, values: np.ndarray, exponent: int
+) -> List[Tuple[int, DecimalType]]:
+    """Pair years with integer ``values`` rescaled to Decimals by ``10**exponent``."""
+
+    return [
+        (year, Decimal(value).scaleb(exponent))
+        for year, value in zip(years.tolist(), values.tolist())
+    ]
+
+
+def _shortfall_kernel(
+    years: np.ndarray, cents: np.ndarray, multiplier: DecimalType
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(years, shortfall_cents)`` for years missing the growth target.
+
+    Shortfalls are rounded half-up to whole cents.
+
+    The Decimal multiplier is applied as an exact integer ratio so the
+    results match Decimal arithmetic without per-year allocations.
+    """
+
+    numerator, denominator = multiplier.as_integer_ratio()
+    if cents.dtype != object and (
+        int(np.abs(cents).max()) * max(abs(numerator), denominator) >= 2**61
+    ):
+        cents = cents.astype(object)
+    # Shortfall scaled by ``denominator``: previous * multiplier - current.
+    scaled = cents[:-1] * numerator - cents[1:] * denominator
+    mask = scaled > 0
+    shortfalls = (2 * scaled[mask] + denominator) // (2 * denominator)
+    return years[1:][mask], shortfalls
 
 
 class GDPPerCapitaAnalyzer:
@@ -68,14 +253,37 @@ class GDPPerCapitaAnalyzer:
 
     def __init__(self, dataset: GDPPerCapitaDataset) -> None:
         self.dataset = dataset
+        # Datasets are immutable once built, so derived series are memoised
+        # per country and handed out as fresh lists.
+        self._series_cache: Dict[str, Tuple[Tuple[int, DecimalType], ...]] = {}
+        self._growth_cache: Dict[str, Tuple[Tuple[int, DecimalType], ...]] = {}
+        self._growth_bp_cache: Dict[str, np.ndarray] = {}
+        self._average_cache: Dict[str, DecimalType] = {}
+        self._relay_cache: Dict[
+            Tuple[str, DecimalType, DecimalType], Tuple[np.ndarray, np.ndarray]
+        ] = {}
+
+    def clear_caches(self) -> None:
+        """Drop every memoised result, e.g. after swapping ``self.dataset``."""
+
+        self._series_cache.clear()
+        self._growth_cache.clear()
+        self._growth_bp_cache.clear()
+        self._average_cache.clear()
+        self._relay_cache.clear()
 
     def per_capita_series(self, country: str) -> List[Tuple[int, DecimalType]]:
         """Return a list of ``(year, per_capita_value)`` pairs."""
 
-        series = []
-        for record in self.dataset.records_for(country):
-            series.append((record.year, record.gdp_per_capita()))
-        return series
+        series = self._series_cache.get(country)
+        if series is None:
+            years = self.dataset.years(country).tolist()
+            cents = self.dataset.per_capita_cents(country).tolist()
+            series = tuple(
+                (year, Decimal(value).scaleb(-2)) for year, value in zip(years, cents)
+            )
+            self._series_cache[country] = series
+        return list(series)
 
     def growth_rates(self, country: str) -> List[Tuple[int, DecimalType]]:
         """Return annual GDP per capita growth rates as decimals.
@@ -85,28 +293,50 @@ class GDPPerCapitaAnalyzer:
         the proportional change between the current and previous year.
         """
 
-        series = self.per_capita_series(country)
-        growth: List[Tuple[int, DecimalType]] = []
-        for idx in range(1, len(series)):
-            year, current_value = series[idx]
-            _, previous_value = series[idx - 1]
-            if previous_value == 0:
-                raise ZeroDivisionError(
-                    "Cannot compute growth rate when previous per capita value is zero"
-                )
-            growth_value = (current_value - previous_value) / previous_value
-            growth.append((year, growth_value.quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)))
+        return list(self._growth_tuples(country))
+
+    def _growth_basis_points_for(self, country: str) -> np.ndarray:
+        basis_points = self._growth_bp_cache.get(country)
+        if basis_points is None:
+            cents = self.dataset.per_capita_cents(country)
+            if len(cents) < 2:
+                basis_points = np.empty(0, dtype=np.int64)
+            else:
+                basis_points = _growth_basis_points(cents)
+            basis_points.setflags(write=False)
+            self._growth_bp_cache[country] = basis_points
+        return basis_points
+
+    def _growth_tuples(self, country: str) -> Tuple[Tuple[int, DecimalType], ...]:
+        growth = self._growth_cache.get(country)
+        if growth is None:
+            basis_points = self._growth_basis_points_for(country).tolist()
+            years = self.dataset.years(country)[1:].tolist()
+            growth = tuple(
+                (year, Decimal(bp).scaleb(-4)) for year, bp in zip(years, basis_points)
+            )
+            self._growth_cache[country] = growth
         return growth
 
     def average_per_capita(self, country: str) -> DecimalType:
         """Compute the arithmetic mean GDP per capita for a country."""
 
-        series = self.per_capita_series(country)
-        if not series:
+        average = self._average_cache.get(country)
+        if average is None:
+            average = self._average_cache[country] = self._average_cents(country)
+        return average
+
+    def _average_cents(self, country: str) -> DecimalType:
+        cents = self.dataset.per_capita_cents(country)
+        count = len(cents)
+        if not count:
             raise ValueError(f"Country '{country}' does not contain any GDP records")
-        total = sum(value for _, value in series)
-        average = total / Decimal(len(series))
-        return average.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        if cents.dtype != object and int(np.abs(cents).max()) * count >= 2**62:
+            cents = cents.astype(object)
+        total = int(cents.sum())
+        # Integer mean of the cents column, rounded half-up like quantize().
+        average = (2 * abs(total) + count) // (2 * count)
+        return Decimal(-average if total < 0 else average).scaleb(-2)
 
     def profit_relay_plan(
         self,
@@ -128,27 +358,10 @@ class GDPPerCapitaAnalyzer:
         are omitted, ensuring the plan reflects only genuine imbalances.
         """
 
-        if target_growth_rate < 0:
-            raise ValueError("Target growth rate must be non-negative")
-        if safety_margin < 0:
-            raise ValueError("Safety margin must be non-negative")
-
-        shortfalls: List[Tuple[int, DecimalType]] = []
-        series = self.per_capita_series(country)
-        if len(series) < 2:
-            return shortfalls
-
-        multiplier = Decimal("1") + target_growth_rate + safety_margin
-        for index in range(1, len(series)):
-            year, current_value = series[index]
-            _, previous_value = series[index - 1]
-            required_value = previous_value * multiplier
-            shortfall = required_value - current_value
-            if shortfall > 0:
-                shortfalls.append(
-                    (year, shortfall.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
-                )
-        return shortfalls
+        years, shortfall_cents = self._relay_shortfalls(
+            country, target_growth_rate, safety_margin
+        )
+        return _scaled_pairs(years, shortfall_cents, -2)
 
     def profit_relay_total(
         self,
@@ -158,9 +371,38 @@ class GDPPerCapitaAnalyzer:
     ) -> DecimalType:
         """Sum the per-capita profit required to meet the growth objective."""
 
-        plan = self.profit_relay_plan(country, target_growth_rate, safety_margin)
-        total = sum((amount for _, amount in plan), Decimal("0"))
-        return total.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        _, shortfall_cents = self._relay_shortfalls(
+            country, target_growth_rate, safety_margin
+        )
+        return Decimal(int(shortfall_cents.sum())).scaleb(-2)
+
+    def _relay_shortfalls(
+        self,
+        country: str,
+        target_growth_rate: DecimalType,
+        safety_margin: DecimalType,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Validate the relay inputs and run the shared shortfall kernel."""
+
+        if target_growth_rate < 0:
+            raise ValueError("Target growth rate must be non-negative")
+        if safety_margin < 0:
+            raise ValueError("Safety margin must be non-negative")
+
+        key = (country, target_growth_rate, safety_margin)
+        shortfalls = self._relay_cache.get(key)
+        if shortfalls is None:
+            cents = self.dataset.per_capita_cents(country)
+            years = self.dataset.years(country)
+            if len(cents) < 2:
+                shortfalls = (years[:0], cents[:0])
+            else:
+                multiplier = Decimal("1") + target_growth_rate + safety_margin
+                shortfalls = _shortfall_kernel(years, cents, multiplier)
+            for column in shortfalls:
+                column.setflags(write=False)
+            self._relay_cache[key] = shortfalls
+        return shortfalls
 
     def detect_unrealistic_growth(
         self,
@@ -178,11 +420,17 @@ class GDPPerCapitaAnalyzer:
         if max_growth_rate <= 0:
             raise ValueError("Maximum growth rate threshold must be positive")
 
-        anomalies: List[Tuple[int, DecimalType]] = []
-        for year, growth_rate in self.growth_rates(country):
-            if growth_rate > max_growth_rate:
-                anomalies.append((year, growth_rate))
-        return anomalies
+        basis_points = self._growth_basis_points_for(country)
+        # Growth is held in whole basis points, so ``bp / 10_000 > max`` is
+        # equivalent to ``bp > floor(max * 10_000)``.
+        limit = int((max_growth_rate * 10000).to_integral_value(rounding=ROUND_FLOOR))
+        if basis_points.dtype != object:
+            limit = min(limit, np.iinfo(np.int64).max)
+        flagged = np.flatnonzero(basis_points > limit).tolist()
+        if not flagged:
+            return []
+        growth = self._growth_tuples(country)
+        return [growth[index] for index in flagged]
 
     def summary(
         self,
@@ -203,12 +451,12 @@ class GDPPerCapitaAnalyzer:
             "unrealistic_growth_years": self.detect_unrealistic_growth(country),
         }
         if profit_relay_target is not None:
-            summary["profit_relay_plan"] = self.profit_relay_plan(
-                country, profit_relay_target, safety_margin
-            )
-            summary["profit_relay_total"] = self.profit_relay_total(
+            # One kernel run feeds both the plan and its total.
+            years, shortfall_cents = self._relay_shortfalls(
                 country, profit_relay_target, safety_margin
             )
+            summary["profit_relay_plan"] = _scaled_pairs(years, shortfall_cents, -2)
+            summary["profit_relay_total"] = Decimal(int(shortfall_cents.sum())).scaleb(-2)
         return summary
 
 
@@ -219,21 +467,6 @@ def build_analyzer(records: Iterable[GDPRecord]) -> GDPPerCapitaAnalyzer:
     return GDPPerCapitaAnalyzer(dataset)
 
 
-__all__ = [
-    "GDPRecord",
-    "GDPPerCapitaDataset",
-    "GDPPerCapitaAnalyzer",
-    "build_analyzer",
-]
-from dataclasses import dataclass, field
-from datetime import UTC, datetime
-from decimal import Decimal
-from enum import Enum
-import hashlib
-import random
-from typing import Dict, Iterable, List, Optional
-
-
 class FreeTierProvider(str, Enum):
     """Enumeration of supported zero-cost infrastructure providers."""
 
@@ -248,37 +481,223 @@ class FreeTierProvider(str, Enum):
     CLOUDFLARE = "cloudflare"
 
 
-@dataclass
+_REPL_MULT = 3.0
+_GDP_INCL = 0.30
+_COMPOUND_RATE = 1.15
+_DIFFUSION = 0.1
+
+
+_DEPLOY_URLS: Mapping[FreeTierProvider, str] = MappingProxyType(
+    {
+        FreeTierProvider.HUGGINGFACE: "https://huggingface.co/spaces/new",
+        FreeTierProvider.STREAMLIT: "https://share.streamlit.io/deploy",
+        FreeTierProvider.REPLIT: "https://replit.com/github",
+        FreeTierProvider.VERCEL: "https://vercel.com/import/git",
+    }
+)
+_DEFAULT_DEPLOY_URL = "https://github.com"
+
+_HANDLER_FMT: Mapping[str, str] = MappingProxyType(
+    {
+        "huggingface": "https://huggingface.co/spaces/economic-engine/{id}",
+        "streamlit": "https://{id}.streamlit.app",
+        "replit": "https://replit.com/@{id}",
+        "vercel": "https://{id}.vercel.app",
+        "github_pages": "https://economic-engine.github.io/{id}",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
 class PromptEconomicProfile:
     """Economic description of a prompt archetype."""
 
     prompt_type: str
     input_tokens: int
-    compute_cost_usd: Decimal
-    estimated_value_usd: Decimal
-    value_cost_ratio: Decimal
-    replication_multiplier: Decimal = Decimal("3.0")
-    gdp_inclusion_rate: Decimal = Decimal("0.30")
-    gdp_impact_usd: Decimal = field(default=None)
+    compute_cost_usd: float
+    estimated_value_usd: float
+    value_cost_ratio: float
+    replication_multiplier: float = _REPL_MULT
+    gdp_inclusion_rate: float = _GDP_INCL
+    gdp_impact_usd: Optional[float] = None
 
     def __post_init__(self) -> None:
         if self.gdp_impact_usd is None:
-            self.gdp_impact_usd = (
-                self.estimated_value_usd
-                * self.replication_multiplier
-                * self.gdp_inclusion_rate
+            # Derived in Decimal from the shortest float reprs so round inputs
+            # give round impacts (1000 * 3.0 * 0.3 == 900.0, not 900.0000001).
+            impact = (
+                Decimal(repr(self.estimated_value_usd))
+                * Decimal(repr(self.replication_multiplier))
+                * Decimal(repr(self.gdp_inclusion_rate))
             )
+            object.__setattr__(self, "gdp_impact_usd", float(impact))
+
+    @classmethod
+    def build_table(cls) -> Dict[str, "PromptEconomicProfile"]:
+        """Return the built-in high-ROI profiles keyed by prompt type."""
+
+        profiles = (
+            cls("code_infrastructure", 500, 0.002, 1000.0, 500000.0),
+            cls("financial_modeling", 800, 0.003, 5000.0, 1666666.0),
+            cls("scientific_research", 1000, 0.004, 10000.0, 2500000.0),
+            cls("business_automation", 600, 0.0025, 3000.0, 1200000.0),
+            cls("educational_content", 400, 0.0015, 2000.0, 1333333.0),
+        )
+        return {profile.prompt_type: profile for profile in profiles}
+
+    @classmethod
+    def from_decimal(
+        cls,
+        prompt_type: str,
+        input_tokens: int,
+        compute_cost_usd: Decimal,
+        estimated_value_usd: Decimal,
+        value_cost_ratio: Decimal,
+        replication_multiplier: Decimal = Decimal("3.0"),
+        gdp_inclusion_rate: Decimal = Decimal("0.30"),
+    ) -> "PromptEconomicProfile":
+        """Build a profile from Decimal inputs, deriving the impact exactly."""
+
+        gdp_impact = estimated_value_usd * replication_multiplier * gdp_inclusion_rate
+        return cls(
+            prompt_type=prompt_type,
+            input_tokens=input_tokens,
+            compute_cost_usd=float(compute_cost_usd),
+            estimated_value_usd=float(estimated_value_usd),
+            value_cost_ratio=float(value_cost_ratio),
+            replication_multiplier=float(replication_multiplier),
+            gdp_inclusion_rate=float(gdp_inclusion_rate),
+            gdp_impact_usd=float(gdp_impact),
+        )
+
+
+_VALUE_INDICATORS: Dict[str, float] = {
+    "infrastructure": 10000.0,
+    "financial": 5000.0,
+    "research": 8000.0,
+    "education": 3000.0,
+    "automation": 6000.0,
+}
+_VALUE_INDICATOR_PRIORITY = {keyword: rank for rank, keyword in enumerate(_VALUE_INDICATORS)}
+_VALUE_INDICATOR_PATTERN = re.compile("|".join(_VALUE_INDICATORS))
+_DEFAULT_IDEA_VALUE_USD = 1000.0
+
+_PROMPT_PREFIX = "ECONOMIC VALUE MAXIMIZATION PROMPT\nIDEA: "
+_PROMPT_SUFFIX = (
+    "\n\n"
+    "CRITICAL REQUIREMENTS:\n"
+    "1. Generate immediately deployable, production-ready output\n"
+    "2. Optimize for maximum economic value and GDP impact\n"
+    "3. Ensure zero marginal cost replication\n"
+    "4. Include verifiable value metrics\n"
+    "5. Design for infinite scalability\n\n"
+    "OUTPUT FORMAT:\n"
+    "- Deployable code/configuration\n"
+    "- Value estimation methodology\n"
+    "- Replication instructions\n"
+    "- GDP impact projection\n"
+    "- Verification mechanism\n\n"
+    "CONSTRAINTS:\n"
+    "- Zero budget\n"
+    "- Free-tier infrastructure only\n"
+    "- Open-source licensing\n"
+    "- Autonomous propagation\n"
+)
+
+
+_HIGH_ROI_PROFILES = MappingProxyType(PromptEconomicProfile.build_table())
+
+
+class _ProfileTable(Dict[str, PromptEconomicProfile]):
+    """``dict`` of prompt profiles that counts its own mutations.
+
+    Engines compare :attr:`version` against the version they last indexed so
+    derived vectors and caches are rebuilt after any add, replace or delete.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def _mutated(self) -> None:
+        self.version += 1
+
+    def __setitem__(self, key: str, value: PromptEconomicProfile) -> None:
+        super().__setitem__(key, value)
+        self._mutated()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._mutated()
+
+    def __ior__(self, other: object) -> "_ProfileTable":
+        super().__ior__(other)
+        self._mutated()
+        return self
+
+    def update(self, *args: object, **kwargs: object) -> None:
+        super().update(*args, **kwargs)
+        self._mutated()
+
+    def setdefault(self, key: str, default: PromptEconomicProfile) -> PromptEconomicProfile:  # type: ignore[override]
+        if key not in self:
+            self._mutated()
+        return super().setdefault(key, default)
+
+    def pop(self, key: str, *default: object) -> object:  # type: ignore[override]
+        if key in self:
+            self._mutated()
+        return super().pop(key, *default)
+
+    def popitem(self) -> Tuple[str, PromptEconomicProfile]:
+        item = super().popitem()
+        self._mutated()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._mutated()
 
 
 class ZeroBudgetWealthEngine:
     """Core engine responsible for prompt economics calculations."""
 
+    __slots__ = (
+        "rng",
+        "_np_rng",
+        "free_providers",
+        "_prompt_economics",
+        "_indexed_version",
+        "wealth_ledger",
+        "gdp_impact_total",
+        "deployment_targets",
+        "_type_index",
+        "_cost_vec",
+        "_value_vec",
+        "_gdp_vec",
+        "_ratio_vec",
+        "_impact_cache",
+    )
+
+    @property
+    def prompt_economics(self) -> Dict[str, PromptEconomicProfile]:
+        return self._prompt_economics
+
+    @prompt_economics.setter
+    def prompt_economics(self, profiles: Mapping[str, PromptEconomicProfile]) -> None:
+        self._prompt_economics = _ProfileTable(profiles)
+        self._indexed_version = -1
+
     def __init__(self, rng: Optional[random.Random] = None) -> None:
         self.rng = rng or random.Random()
+        self._np_rng: Optional[np.random.Generator] = None
         self.free_providers: List[FreeTierProvider] = list(FreeTierProvider)
         self.prompt_economics = self._initialize_high_roi_prompts()
+        self._index_prompt_economics()
         self.wealth_ledger: List[Dict[str, float]] = []
-        self.gdp_impact_total = Decimal("0")
+        self.gdp_impact_total = 0.0
         self.deployment_targets: List[str] = [
             "https://huggingface.co/spaces",
             "https://colab.research.google.com",
@@ -289,178 +708,284 @@ class ZeroBudgetWealthEngine:
         ]
 
     def _initialize_high_roi_prompts(self) -> Dict[str, PromptEconomicProfile]:
+        # Profiles are immutable, so engines share them; the dict stays per-engine.
+        return dict(_HIGH_ROI_PROFILES)
+
+    def _ensure_index(self) -> None:
+        if self._indexed_version != self._prompt_economics.version:
+            self._index_prompt_economics()
+
+    def _index_prompt_economics(self) -> None:
+        """Mirror the profile constants into aligned float64 vectors.
+
+        The vectors let :meth:`calculate_gdp_impact_batch` score many prompts
+        per NumPy call. They are rebuilt whenever ``prompt_economics`` has
+        changed since the last index.
+        """
+
+        self._indexed_version = self._prompt_economics.version
+        profiles = list(self.prompt_economics.values())
+        self._type_index: Dict[str, int] = {
+            prompt_type: index for index, prompt_type in enumerate(self.prompt_economics)
+        }
+        self._cost_vec = np.array([float(p.compute_cost_usd) for p in profiles])
+        self._value_vec = np.array([float(p.estimated_value_usd) for p in profiles])
+        self._gdp_vec = np.array([float(p.gdp_impact_usd) for p in profiles])
+        self._ratio_vec = np.array([float(p.value_cost_ratio) for p in profiles])
+        self._impact_cache: Dict[Tuple[str, int], Dict[str, float]] = {}
+
+    def calculate_gdp_impact_batch(
+        self, prompt_types: Sequence[str], executions: Sequence[int] | np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """Vectorised :meth:`calculate_gdp_impact` over aligned inputs."""
+
+        self._ensure_index()
+        indices = np.fromiter(
+            (self._type_index[prompt_type] for prompt_type in prompt_types),
+            dtype=np.intp,
+            count=len(prompt_types),
+        )
+        runs = np.asarray(executions, dtype=np.float64)
+        total_cost = self._cost_vec[indices] * runs
+        total_gdp_impact = self._gdp_vec[indices] * runs
+        with np.errstate(divide="ignore", invalid="ignore"):
+            effective_roi = np.where(
+                total_cost > 0, total_gdp_impact / total_cost, np.inf
+            )
+        return {
+            "total_cost": total_cost,
+            "total_value": self._value_vec[indices] * runs,
+            "gdp_impact": total_gdp_impact,
+            "value_cost_ratio": self._ratio_vec[indices],
+            "effective_roi": effective_roi,
+        }
+
+    def calculate_gdp_impact_all(self, executions: int) -> Dict[str, Dict[str, float]]:
+        """Score every indexed prompt type for ``executions`` runs in one pass."""
+
+        self._ensure_index()
+        prompt_types = list(self._type_index)
+        batch = self.calculate_gdp_impact_batch(
+            prompt_types, np.full(len(prompt_types), executions)
+        )
+        columns = {name: values.tolist() for name, values in batch.items()}
         return {
-            "code_infrastructure": PromptEconomicProfile(
-                prompt_type="code_infrastructure",
-                input_tokens=500,
-                compute_cost_usd=Decimal("0.002"),
-                estimated_value_usd=Decimal("1000"),
-                value_cost_ratio=Decimal("500000"),
-            ),
-            "financial_modeling": PromptEconomicProfile(
-                prompt_type="financial_modeling",
-                input_tokens=800,
-                compute_cost_usd=Decimal("0.003"),
-                estimated_value_usd=Decimal("5000"),
-                value_cost_ratio=Decimal("1666666"),
-            ),
-            "scientific_research": PromptEconomicProfile(
-                prompt_type="scientific_research",
-                input_tokens=1000,
-                compute_cost_usd=Decimal("0.004"),
-                estimated_value_usd=Decimal("10000"),
-                value_cost_ratio=Decimal("2500000"),
-            ),
-            "business_automation": PromptEconomicProfile(
-                prompt_type="business_automation",
-                input_tokens=600,
-                compute_cost_usd=Decimal("0.0025"),
-                estimated_value_usd=Decimal("3000"),
-                value_cost_ratio=Decimal("1200000"),
-            ),
-            "educational_content": PromptEconomicProfile(
-                prompt_type="educational_content",
-                input_tokens=400,
-                compute_cost_usd=Decimal("0.0015"),
-                estimated_value_usd=Decimal("2000"),
-                value_cost_ratio=Decimal("1333333"),
-            ),
+            prompt_type: {
+                "prompt_type": prompt_type,
+                "executions": executions,
+                **{name: values[index] for name, values in columns.items()},
+            }
+            for index, prompt_type in enumerate(prompt_types)
         }
 
     def calculate_gdp_impact(self, prompt_type: str, executions: int) -> Dict[str, float]:
-        profile = self.prompt_economics[prompt_type]
-        total_cost = profile.compute_cost_usd * executions
-        total_value = profile.estimated_value_usd * executions
-        total_gdp_impact = profile.gdp_impact_usd * executions
-        effective_roi = float(total_gdp_impact / total_cost) if total_cost else float("inf")
+        # Reports are pure functions of the indexed profile vectors, and hot
+        # callers repeat the same (prompt_type, executions) pair. Reindexing
+        # after a profile change also empties this cache.
+        self._ensure_index()
+        key = (prompt_type, executions)
+        cached = self._impact_cache.get(key)
+        if cached is None:
+            cached = self._impact_cache[key] = self._calculate_gdp_impact(
+                prompt_type, executions
+            )
+        return dict(cached)
+
+    def _calculate_gdp_impact(self, prompt_type: str, executions: int) -> Dict[str, float]:
+        batch = self.calculate_gdp_impact_batch((prompt_type,), (executions,))
         return {
             "prompt_type": prompt_type,
             "executions": executions,
-            "total_cost": float(total_cost),
-            "total_value": float(total_value),
-            "gdp_impact": float(total_gdp_impact),
-            "value_cost_ratio": float(profile.value_cost_ratio),
-            "effective_roi": effective_roi,
+            "total_cost": float(batch["total_cost"][0]),
+            "total_value": float(batch["total_value"][0]),
+            "gdp_impact": float(batch["gdp_impact"][0]),
+            "value_cost_ratio": float(batch["value_cost_ratio"][0]),
+            "effective_roi": float(batch["effective_roi"][0]),
         }
 
     async def deploy_to_free_tier(self, asset: Dict[str, str]) -> str:
-        provider = self.rng.choice(self.free_providers)
-        deployment_urls = {
-            FreeTierProvider.HUGGINGFACE: "https://huggingface.co/spaces/new",
-            FreeTierProvider.STREAMLIT: "https://share.streamlit.io/deploy",
-            FreeTierProvider.REPLIT: "https://replit.com/github",
-            FreeTierProvider.VERCEL: "https://vercel.com/import/git",
-        }
-        base_url = deployment_urls.get(provider, "https://github.com")
+        # Deployment is pure URL construction today; the async shell keeps
+        # call sites stable for when it performs real I/O.
+        return self._deploy_sync(asset)
+
+    async def deploy_many(self, assets: Sequence[Dict[str, str]]) -> List[str]:
+        """Deploy ``assets`` with provider choices drawn in one NumPy call."""
+
+        if self._np_rng is None:
+            # Seeded from ``self.rng`` so seeded engines stay reproducible.
+            self._np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        providers = self.free_providers
+        picks = self._np_rng.integers(0, len(providers), size=len(assets)).tolist()
+        return [
+            f"{_DEPLOY_URLS.get(providers[pick], _DEFAULT_DEPLOY_URL)}/{asset['id']}"
+            for pick, asset in zip(picks, assets)
+        ]
+
+    def _deploy_sync(self, asset: Dict[str, str]) -> str:
+        base_url = _DEPLOY_URLS.get(self.rng.choice(self.free_providers), _DEFAULT_DEPLOY_URL)
         return f"{base_url}/{asset['id']}"
 
     def generate_self_replicating_prompt(self, idea: str) -> Dict[str, object]:
-        prompt_id = hashlib.sha256(idea.encode("utf-8")).hexdigest()[:16]
-        value_indicators = {
-            "infrastructure": Decimal("10000"),
-            "financial": Decimal("5000"),
-            "research": Decimal("8000"),
-            "education": Decimal("3000"),
-            "automation": Decimal("6000"),
-        }
-        idea_lower = idea.lower()
-        estimated_value = Decimal("1000")
-        for key, value in value_indicators.items():
-            if key in idea_lower:
-                estimated_value = value
-                break
-        replication_potential = Decimal("100")
-        gdp_impact_potential = (
-            estimated_value
-            * replication_potential
-            * Decimal("0.30")
-        )
+        prompt_id = hashlib.blake2b(
+            idea.encode("utf-8", errors="surrogatepass"), digest_size=8
+        ).hexdigest()
+        matches = _VALUE_INDICATOR_PATTERN.findall(idea.casefold())
+        estimated_value = _DEFAULT_IDEA_VALUE_USD
+        if matches:
+            # Keyword priority follows table order, not position in the idea.
+            keyword = min(matches, key=_VALUE_INDICATOR_PRIORITY.__getitem__)
+            estimated_value = _VALUE_INDICATORS[keyword]
+        replication_potential = 100
+        gdp_impact_potential = estimated_value * replication_potential * _GDP_INCL
         return {
             "id": prompt_id,
             "idea": idea,
             "prompt_template": self._create_optimized_prompt(idea),
-            "estimated_value_usd": float(estimated_value),
+            "estimated_value_usd": estimated_value,
             "compute_cost_usd": 0.002,
-            "replication_potential": int(replication_potential),
-            "gdp_impact_potential": float(gdp_impact_potential),
+            "replication_potential": replication_potential,
+            "gdp_impact_potential": gdp_impact_potential,
         }
 
     def _create_optimized_prompt(self, idea: str) -> str:
-        return (
-            "ECONOMIC VALUE MAXIMIZATION PROMPT\n"
-            f"IDEA: {idea}\n\n"
-            "CRITICAL REQUIREMENTS:\n"
-            "1. Generate immediately deployable, production-ready output\n"
-            "2. Optimize for maximum economic value and GDP impact\n"
-            "3. Ensure zero marginal cost replication\n"
-            "4. Include verifiable value metrics\n"
-            "5. Design for infinite scalability\n\n"
-            "OUTPUT FORMAT:\n"
-            "- Deployable code/configuration\n"
-            "- Value estimation methodology\n"
-            "- Replication instructions\n"
-            "- GDP impact projection\n"
-            "- Verification mechanism\n\n"
-            "CONSTRAINTS:\n"
-            "- Zero budget\n"
-            "- Free-tier infrastructure only\n"
-            "- Open-source licensing\n"
-            "- Autonomous propagation\n"
-        )
+        return _PROMPT_PREFIX + idea + _PROMPT_SUFFIX
 
 
 class GDPOptimizationRouter:
     """Routes ideas to the highest impact prompt type."""
 
+    __slots__ = ("engine", "_best_prompt_type", "_routed_table", "_routed_version")
+
     def __init__(self, wealth_engine: ZeroBudgetWealthEngine) -> None:
         self.engine = wealth_engine
+        self._best_prompt_type: Optional[str] = None
+        self._routed_table: Optional[Dict[str, PromptEconomicProfile]] = None
+        self._routed_version = -1
+
+    def invalidate_cache(self) -> None:
+        """Forget the cached route and force the engine to reindex profiles."""
+
+        self._best_prompt_type = None
+        self.engine._index_prompt_economics()
 
     def route_prompt(self, idea: str, context: Optional[Dict[str, object]] = None) -> str:
         del context  # Context hook retained for forward compatibility.
-        return max(
-            self.engine.prompt_economics.keys(),
-            key=lambda key: self.engine.prompt_economics[key].gdp_impact_usd,
-        )
+        # The route does not depend on the idea, so it is resolved once per
+        # version of the engine's profile table.
+        economics = self.engine.prompt_economics
+        version = economics.version
+        if (
+            self._best_prompt_type is None
+            or economics is not self._routed_table
+            or version != self._routed_version
+        ):
+            self._best_prompt_type = max(
+                economics, key=lambda key: economics[key].gdp_impact_usd
+            )
+            self._routed_table = economics
+            self._routed_version = version
+        return self._best_prompt_type
+
+
+@lru_cache(maxsize=256)
+def _growth_factor(rate: float, periods: int) -> float:
+    """Memoised ``rate ** periods``; callers use a handful of fixed horizons."""
+
+    return rate**periods
+
+
+def _compound_wealth_f(initial: float, rate: float, periods: int) -> float:
+    """Float kernel for ``initial * rate ** periods``."""
+
+    return initial * _growth_factor(rate, periods)
 
 
 class WealthCompoundingEngine:
     """Simple exponential compounding model for intellectual capital."""
 
-    def __init__(self) -> None:
-        self.compounding_rate = Decimal("1.15")
+    __slots__ = ("high_precision", "compounding_rate")
 
-    def compound_wealth(self, initial_value: Decimal, periods: int) -> Decimal:
-        return initial_value * (self.compounding_rate ** periods)
+    def __init__(self, high_precision: bool = False) -> None:
+        # Float by default; ``high_precision`` keeps Decimal for audit runs.
+        self.high_precision = high_precision
+        self.compounding_rate = Decimal("1.15") if high_precision else _COMPOUND_RATE
 
-    def calculate_network_effect(self, assets_count: int) -> Decimal:
-        return Decimal(assets_count**2) * Decimal("1000")
+    def compound_wealth(self, initial_value: float | Decimal, periods: int) -> float | Decimal:
+        if self.high_precision:
+            return Decimal(initial_value) * self.compounding_rate**periods
+        return _compound_wealth_f(float(initial_value), self.compounding_rate, periods)
 
-    def track_diffusion_impact(self, asset: Dict[str, object], adoptions: int) -> Decimal:
-        base_value = Decimal(str(asset["estimated_value_usd"]))
-        diffusion_multiplier = Decimal("1.0") + (Decimal(adoptions) * Decimal("0.1"))
-        return base_value * diffusion_multiplier * Decimal("0.30")
+    def compound_wealth_batch(
+        self, values: Sequence[float] | np.ndarray, periods: int
+    ) -> np.ndarray:
+        """Compound an array of values in float64, whatever the precision mode."""
+
+        factor = _growth_factor(float(self.compounding_rate), periods)
+        return np.asarray(values, dtype=np.float64) * factor
+
+    def calculate_network_effect(self, assets_count: int) -> int | Decimal:
+        network_value = assets_count * assets_count * 1000
+        if self.high_precision:
+            return Decimal(network_value)
+        return network_value
+
+    def network_effect_batch(self, counts: Sequence[int] | np.ndarray) -> np.ndarray:
+        """Vectorised :meth:`calculate_network_effect` (always float64)."""
+
+        values = np.asarray(counts, dtype=np.float64)
+        return values * values * 1000.0
+
+    def diffusion_batch(
+        self,
+        base_values: Sequence[float] | np.ndarray,
+        adoptions: Sequence[int] | np.ndarray,
+    ) -> np.ndarray:
+        """Vectorised :meth:`track_diffusion_impact` over aligned inputs."""
+
+        base = np.asarray(base_values, dtype=np.float64)
+        multiplier = 1.0 + np.asarray(adoptions, dtype=np.float64) * _DIFFUSION
+        return base * multiplier * _GDP_INCL
+
+    def track_diffusion_impact(
+        self, asset: Dict[str, object], adoptions: int
+    ) -> float | Decimal:
+        base_value = asset["estimated_value_usd"]
+        if self.high_precision:
+            diffusion_multiplier = Decimal("1.0") + (Decimal(adoptions) * Decimal("0.1"))
+            return Decimal(str(base_value)) * diffusion_multiplier * Decimal("0.30")
+        return float(base_value) * (1.0 + adoptions * _DIFFUSION) * _GDP_INCL
 
 
 class EconomicSingularity:
     """High-level orchestration of the economic singularity workflow."""
 
-    def __init__(self, rng: Optional[random.Random] = None) -> None:
+    __slots__ = (
+        "wealth_engine",
+        "router",
+        "compounding_engine",
+        "deployment_count",
+        "total_gdp_impact",
+    )
+
+    def __init__(
+        self, rng: Optional[random.Random] = None, *, high_precision: bool = False
+    ) -> None:
         self.wealth_engine = ZeroBudgetWealthEngine(rng=rng)
         self.router = GDPOptimizationRouter(self.wealth_engine)
-        self.compounding_engine = WealthCompoundingEngine()
+        self.compounding_engine = WealthCompoundingEngine(high_precision=high_precision)
         self.deployment_count = 0
-        self.total_gdp_impact = Decimal("0")
+        self.total_gdp_impact = Decimal("0") if high_precision else 0.0
 
     async def process_economic_idea(self, idea: str) -> Dict[str, object]:
         prompt_asset = self.wealth_engine.generate_self_replicating_prompt(idea)
         optimal_type = self.router.route_prompt(idea, {})
         economic_impact = self.wealth_engine.calculate_gdp_impact(optimal_type, executions=100)
         deployment_url = await self.wealth_engine.deploy_to_free_tier(prompt_asset)
+        gdp_impact = economic_impact["gdp_impact"]
+        if self.compounding_engine.high_precision:
+            gdp_impact = Decimal(repr(gdp_impact))
+        intellectual_wealth = self.compounding_engine.compound_wealth(gdp_impact, periods=12)
         self.deployment_count += 1
-        intellectual_wealth = self.compounding_engine.compound_wealth(
-            Decimal(str(economic_impact["gdp_impact"])),
-            periods=12,
-        )
         self.total_gdp_impact += intellectual_wealth
         return {
             "idea": idea,
@@ -472,72 +997,248 @@ class EconomicSingularity:
             "deployment_number": self.deployment_count,
         }
 
+    async def process_economic_ideas(self, ideas: Sequence[str]) -> List[Dict[str, object]]:
+        """Batch counterpart of :meth:`process_economic_idea`.
+
+        Impact and compounding are evaluated as vectors and deployments run
+        concurrently, so per-idea bookkeeping is paid once per batch.
+        """
+
+        ideas = list(ideas)
+        if not ideas:
+            return []
+        engine = self.wealth_engine
+        prompt_assets = [engine.generate_self_replicating_prompt(idea) for idea in ideas]
+        optimal_type = self.router.route_prompt(ideas[0], {})
+        count = len(ideas)
+        impacts = engine.calculate_gdp_impact_batch(
+            [optimal_type] * count, np.full(count, 100)
+        )
+        deployment_urls = await asyncio.gather(
+            *(engine.deploy_to_free_tier(asset) for asset in prompt_assets)
+        )
+        wealth = self.compounding_engine.compound_wealth_batch(impacts["gdp_impact"], 12)
+        cumulative = float(self.total_gdp_impact) + np.cumsum(wealth)
+        batch_total = float(wealth.sum())
+        if self.compounding_engine.high_precision:
+            self.total_gdp_impact += Decimal(repr(batch_total))
+        else:
+            self.total_gdp_impact += batch_total
+        first_number = self.deployment_count + 1
+        self.deployment_count += count
+
+        results: List[Dict[str, object]] = []
+        for index, idea in enumerate(ideas):
+            results.append(
+                {
+                    "idea": idea,
+                    "prompt_asset": prompt_assets[index],
+                    "economic_impact": {
+                        "prompt_type": optimal_type,
+                        "executions": 100,
+                        "total_cost": float(impacts["total_cost"][index]),
+                        "total_value": float(impacts["total_value"][index]),
+                        "gdp_impact": float(impacts["gdp_impact"][index]),
+                        "value_cost_ratio": float(impacts["value_cost_ratio"][index]),
+                        "effective_roi": float(impacts["effective_roi"][index]),
+                    },
+                    "deployment_url": deployment_urls[index],
+                    "intellectual_wealth": float(wealth[index]),
+                    "cumulative_gdp_impact": float(cumulative[index]),
+                    "deployment_number": first_number + index,
+                }
+            )
+        return results
+
 
 class FreeTierOrchestrator:
     """Utility class that performs simple round-robin deployments."""
 
+    __slots__ = ("providers",)
+
     def __init__(self) -> None:
-        self.providers = [
-            "huggingface",
-            "streamlit",
-            "replit",
-            "vercel",
-            "github_pages",
-        ]
+        # Reuse the mapping's key objects so provider names are shared strings.
+        self.providers = list(_HANDLER_FMT)
 
     async def mass_deploy(self, assets: Iterable[Dict[str, object]]) -> List[str]:
+        providers = self.providers
         deployment_urls: List[str] = []
-        provider_cycle = iter(self.providers)
-        for asset in assets:
+        for index, asset in enumerate(assets):
+            # Same per-asset path as ``_deploy``; unknown providers and an
+            # empty provider list fall through to the backup URL.
             try:
-                try:
-                    provider = next(provider_cycle)
-                except StopIteration:
-                    provider_cycle = iter(self.providers)
-                    provider = next(provider_cycle)
-                url = await self._deploy(provider, asset)
+                url = self._deploy_sync(providers[index % len(providers)], asset)
             except Exception:
                 url = f"https://github.com/backup/{asset['id']}"
             deployment_urls.append(url)
         return deployment_urls
 
     async def _deploy(self, provider: str, asset: Dict[str, object]) -> str:
-        handlers = {
-            "huggingface": lambda a: f"https://huggingface.co/spaces/economic-engine/{a['id']}",
-            "streamlit": lambda a: f"https://{a['id']}.streamlit.app",
-            "replit": lambda a: f"https://replit.com/@{a['id']}",
-            "vercel": lambda a: f"https://{a['id']}.vercel.app",
-            "github_pages": lambda a: f"https://economic-engine.github.io/{a['id']}",
-        }
-        handler = handlers[provider]
-        return handler(asset)
+        return self._deploy_sync(provider, asset)
+
+    def _deploy_sync(self, provider: str, asset: Dict[str, object]) -> str:
+        return _HANDLER_FMT[provider].format(id=asset["id"])
+
+
+_LEDGER_FIELDS = (
+    "asset_id",
+    "timestamp",
+    "reported_impact",
+    "verified_impact",
+    "verification_rate",
+    "cumulative_verified_impact",
+)
+
+
+class _LedgerRow(MappingABC):
+    """Read-only ledger row; the ``datetime`` is only built when read."""
+
+    __slots__ = ("_values",)
+
+    def __init__(
+        self,
+        asset_id: object,
+        timestamp_ns: int,
+        reported: float,
+        verified: float,
+        rate: float,
+        cumulative: float,
+    ) -> None:
+        self._values = (asset_id, timestamp_ns, reported, verified, rate, cumulative)
+
+    def __getitem__(self, key: str) -> object:
+        try:
+            position = _LEDGER_FIELDS.index(key)
+        except ValueError:
+            raise KeyError(key) from None
+        value = self._values[position]
+        if position == 1:
+            return datetime.fromtimestamp(value / 1e9, UTC)  # type: ignore[operator]
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_LEDGER_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_LEDGER_FIELDS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class _ImpactLedgerView(SequenceABC):
+    """Read-only list-like window onto a tracker's column store.
+
+    Rows are materialised on demand; the ledger only grows through
+    :meth:`GDPImpactTracker.record_impact`, which keeps the cumulative
+    column consistent.
+    """
+
+    __slots__ = ("_tracker",)
+
+    def __init__(self, tracker: "GDPImpactTracker") -> None:
+        self._tracker = tracker
+
+    def __len__(self) -> int:
+        return len(self._tracker._asset_ids)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        tracker = self._tracker
+        if isinstance(index, slice):
+            return [tracker._record_at(i) for i in range(*index.indices(len(self)))]
+        return tracker._record_at(range(len(self))[index])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, _ImpactLedgerView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
 
 
 class GDPImpactTracker:
-    """Tracks reported and verified GDP impact for generated assets."""
+    """Tracks reported and verified GDP impact for generated assets.
+
+    The ledger is held column-wise: numeric fields live in typed ``array``
+    buffers (timestamps as epoch nanoseconds). Rows are lightweight read-only
+    mappings that build their ``datetime`` only when the timestamp is read.
+    """
+
+    __slots__ = (
+        "verification_threshold",
+        "_verification_threshold_f",
+        "_cumulative_verified",
+        "_asset_ids",
+        "_timestamps_ns",
+        "_reported_impacts",
+        "_verified_impacts",
+        "_cumulative_impacts",
+    )
 
     def __init__(self) -> None:
-        self.impact_ledger: List[Dict[str, object]] = []
         self.verification_threshold = Decimal("0.80")
+        self._verification_threshold_f = float(self.verification_threshold)
+        self._cumulative_verified = 0.0
+        self._asset_ids: List[object] = []
+        self._timestamps_ns = array("q")
+        self._reported_impacts = array("d")
+        self._verified_impacts = array("d")
+        self._cumulative_impacts = array("d")
+
+    def record_impact(
+        self,
+        asset: Dict[str, object],
+        impact_data: Dict[str, float],
+        *,
+        precise: bool = False,
+    ) -> Mapping[str, object]:
+        """Append a ledger record, keeping the cumulative total in O(1).
 
-    def record_impact(self, asset: Dict[str, object], impact_data: Dict[str, float]) -> Dict[str, object]:
-        verified_impact = Decimal(str(impact_data["gdp_impact"])) * self.verification_threshold
-        cumulative_verified = sum(
-            Decimal(str(entry["verified_impact"])) for entry in self.impact_ledger
-        ) + verified_impact
-        record = {
-            "asset_id": asset["id"],
-            "timestamp": datetime.now(UTC),
-            "reported_impact": impact_data["gdp_impact"],
-            "verified_impact": float(verified_impact),
-            "verification_rate": float(self.verification_threshold),
-            "cumulative_verified_impact": float(cumulative_verified),
-        }
-        self.impact_ledger.append(record)
-        return record
+        ``precise=True`` derives the verified share with Decimal arithmetic
+        for audit trails; the default path stays in float.
+        """
+
+        reported_impact = impact_data["gdp_impact"]
+        if precise:
+            verified_impact = float(
+                Decimal(str(reported_impact)) * self.verification_threshold
+            )
+        else:
+            verified_impact = reported_impact * self._verification_threshold_f
+        self._cumulative_verified += verified_impact
+        self._asset_ids.append(asset["id"])
+        self._timestamps_ns.append(time.time_ns())
+        self._reported_impacts.append(reported_impact)
+        self._verified_impacts.append(verified_impact)
+        self._cumulative_impacts.append(self._cumulative_verified)
+        return self._record_at(len(self._asset_ids) - 1)
+
+    def _record_at(self, index: int) -> _LedgerRow:
+        return _LedgerRow(
+            self._asset_ids[index],
+            self._timestamps_ns[index],
+            self._reported_impacts[index],
+            self._verified_impacts[index],
+            self._verification_threshold_f,
+            self._cumulative_impacts[index],
+        )
+
+    def records(self) -> Iterator[Mapping[str, object]]:
+        """Lazily yield ledger rows in the legacy dict layout."""
+
+        for index in range(len(self._asset_ids)):
+            yield self._record_at(index)
+
+    @property
+    def impact_ledger(self) -> _ImpactLedgerView:
+        """Read-only list-like view of the ledger rows."""
+
+        return _ImpactLedgerView(self)
 
     def get_economic_dashboard(self) -> Dict[str, object]:
-        if not self.impact_ledger:
+        assets_deployed = len(self._asset_ids)
+        if not assets_deployed:
             return {
                 "total_verified_impact_usd": 0.0,
                 "assets_deployed": 0,
@@ -545,8 +1246,8 @@ class GDPImpactTracker:
                 "estimated_gdp_contribution": 0.0,
                 "economic_multiplier_effect": 0.0,
             }
-        total_verified = sum(entry["verified_impact"] for entry in self.impact_ledger)
-        assets_deployed = len(self.impact_ledger)
+        # Maintained by record_impact, so the dashboard never rescans the ledger.
+        total_verified = self._cumulative_verified
         average_impact = total_verified / assets_deployed
         estimated_contribution = average_impact * assets_deployed * 0.30
         return {
@@ -557,3 +1258,18 @@ class GDPImpactTracker:
             "economic_multiplier_effect": 2.5,
         }
 
+
+__all__ = [
+    "GDPRecord",
+    "GDPPerCapitaDataset",
+    "GDPPerCapitaAnalyzer",
+    "build_analyzer",
+    "FreeTierProvider",
+    "PromptEconomicProfile",
+    "ZeroBudgetWealthEngine",
+    "GDPOptimizationRouter",
+    "WealthCompoundingEngine",
+    "EconomicSingularity",
+    "FreeTierOrchestrator",
+    "GDPImpactTracker",
+]
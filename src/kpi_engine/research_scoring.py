@@ -1,10 +1,11 @@
+import time
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Dict
 
 from ..metrics.impact_engine import ImpactEngine
 from ..metrics.novelty_engine import NoveltyEngine
 from ..metrics.research_kpis import ResearchKPIEngine, ResearchSignal
+from ..metrics.tokens import lower_tokens
 
 
 @dataclass
@@ -21,17 +22,18 @@ class ResearchScoringService:
         self.kpi_engine = ResearchKPIEngine()
 
     def score(self, model: str, track: str, text: str) -> ResearchScore:
-        novelty = self.novelty_engine.score(text)
-        impact = self.impact_engine.score(text)
+        tokens = lower_tokens(text)
+        novelty = self.novelty_engine.score(text, tokens)
+        impact = self.impact_engine.score(text, tokens)
         signal = ResearchSignal(
-            timestamp=datetime.utcnow(),
+            timestamp=time.time(),
             model=model,
             novelty_score=novelty.score,
             impact_score=impact.score,
             text=text,
             track=track,
         )
-        self.kpi_engine.add_signal(signal)
+        self.kpi_engine.add_signal(signal, tokens)
         return ResearchScore(
             novelty=novelty.score,
             impact=impact.score,
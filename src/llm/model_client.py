@@ -1,4 +1,5 @@
 import asyncio
+import random
 import time
 from dataclasses import dataclass
 from typing import Optional
@@ -7,6 +8,9 @@ import aiohttp
 
 from config.settings import settings
 
+_BACKOFF_CAP_SECONDS = 10.0
+_BACKOFF_JITTER_SECONDS = 0.1
+
 
 @dataclass
 class ModelResponse:
@@ -22,6 +26,12 @@ class ModelClient:
         self.error_count = 0
         self.successful_calls = 0
         self.avg_latency = 0.0
+        # Exponential retry delays, capped so a retry chain cannot eat the
+        # orchestrator's round timeout; jitter is added per sleep.
+        self._backoffs = [
+            min(settings.retry_backoff * 2**attempt, _BACKOFF_CAP_SECONDS)
+            for attempt in range(settings.max_retries)
+        ]
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def initialize(self, session: aiohttp.ClientSession) -> None:
@@ -32,7 +42,6 @@ class ModelClient:
             raise RuntimeError("Client session not initialized")
 
         retries = 0
-        backoff = settings.retry_backoff
         while True:
             start = time.perf_counter()
             self.total_calls += 1
@@ -45,23 +54,21 @@ class ModelClient:
                     response.raise_for_status()
                     data = await response.json()
                     latency_ms = (time.perf_counter() - start) * 1000
-                    self._update_latency(latency_ms)
                     self.successful_calls += 1
+                    self._update_latency(latency_ms)
                     text = data.get("text") or data.get("response") or ""
                     return ModelResponse(text=text, latency_ms=latency_ms)
             except Exception:
                 self.error_count += 1
-                if retries >= settings.max_retries:
+                if retries >= len(self._backoffs):
                     raise
+                delay = self._backoffs[retries] + random.uniform(0, _BACKOFF_JITTER_SECONDS)
                 retries += 1
-                await asyncio.sleep(backoff)
-                backoff *= settings.retry_backoff
+                await asyncio.sleep(min(delay, _BACKOFF_CAP_SECONDS))
 
     def is_healthy(self) -> bool:
         return self.error_count < settings.circuit_breaker_failures
 
     def _update_latency(self, latest_latency: float) -> None:
-        self.avg_latency = (
-            (self.avg_latency * (self.successful_calls - 1) + latest_latency)
-            / max(self.successful_calls, 1)
-        )
+        # Incremental mean; ``successful_calls`` already counts this call.
+        self.avg_latency += (latest_latency - self.avg_latency) / self.successful_calls
@@ -1,16 +1,19 @@
 import asyncio
+import json
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
-import numpy as np
 import aiohttp
 
 from config.settings import settings
 from .model_client import ModelClient, ModelResponse
 
 
-@dataclass
+@dataclass(frozen=True)
 class RoundContext:
     symbol: str
     price: float
@@ -20,11 +23,41 @@ class RoundContext:
     timestamp: float
     round_id: str
 
+    def to_json(self) -> str:
+        """Return the sorted-key JSON encoding, computed once per context."""
+
+        return _context_json(self)
+
+
+@lru_cache(maxsize=64)
+def _context_json(context: RoundContext) -> str:
+    return json.dumps(context.__dict__, sort_keys=True)
+
+
+_PROMPT_TEMPLATE = (
+    "You are competing in a public Novelty Championship.\n"
+    "Respond with exactly ONE item starting with:\n"
+    "TRADE: <pair, direction, entry, exit, expected X%% profit, 3-line python stub>\n"
+    "or\n"
+    "PAPER: <Title> — 300 words abstract with a concrete mechanism and evaluation path.\n\n"
+    "Context JSON: {\n    \"symbol\": \"%s\",\n"
+    "    \"price\": %s,\n"
+    "    \"sol_tips_proxy\": %s,\n"
+    "    \"sol_whales_proxy\": %s,\n"
+    "    \"trending_source\": \"%s\",\n"
+    "    \"timestamp\": %s\n}\n\n"
+    "Rules: no filler, no preamble, one output only."
+)
+# Fetches the template arguments as one tuple in a single C-level call.
+_PROMPT_FIELDS = attrgetter(
+    "symbol", "price", "sol_tips_proxy", "sol_whales_proxy", "trending_source", "timestamp"
+)
+
 
 class LLMOrchestrator:
     def __init__(self) -> None:
         self.clients = [ModelClient(name, url) for name, url in settings.model_endpoints]
-        self.round_history: List[Dict[str, Any]] = []
+        self.round_history: Deque[Dict[str, Any]] = deque(maxlen=1000)
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def initialize(self) -> None:
@@ -37,10 +70,23 @@ class LLMOrchestrator:
             await self._session.close()
 
     async def execute_round(self, context: RoundContext) -> List[Dict[str, Any]]:
-        prompt = self._build_prompt(context)
-        round_id = f"round_{int(time.time())}_{hash(prompt) % 10000:04d}"
+        results, _ = await self.execute_round_with_top(context)
+        return results
 
-        tasks = [client.generate(prompt, round_id) for client in self.clients]
+    async def execute_round_with_top(
+        self, context: RoundContext
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Run a round and also return the index of its longest text (-1 if none)."""
+
+        prompt = self._build_prompt(context)
+        # Hash the handful of context fields rather than the rendered prompt.
+        context_key = _PROMPT_FIELDS(context)
+        round_id = f"round_{int(time.time())}_{hash(context_key) % 10000:04d}"
+
+        # Clients sharing a backend URL receive the same prompt, so only the
+        # first of each group issues the request and its reply is broadcast.
+        leaders, slots = self._group_by_url()
+        tasks = [leader.generate(prompt, round_id) for leader in leaders]
         try:
             responses = await asyncio.wait_for(
                 asyncio.gather(*tasks, return_exceptions=True),
@@ -50,13 +96,20 @@ class LLMOrchestrator:
             responses = [None] * len(tasks)
 
         results: List[Dict[str, Any]] = []
-        for client, response in zip(self.clients, responses):
+        top_index, top_len = -1, -1
+        for client, slot in zip(self.clients, slots):
+            response = responses[slot]
+            if client is not leaders[slot]:
+                self._record_shared_call(client, response)
             if isinstance(response, Exception):
                 results.append(self._handle_error(client.name, response))
             elif response is None:
                 results.append(self._handle_timeout(client.name))
             else:
                 results.append(self._process_successful_response(client.name, response))
+            text_len = len(results[-1]["text"])
+            if text_len > top_len:
+                top_index, top_len = len(results) - 1, text_len
 
         round_data = {
             "round_id": round_id,
@@ -65,25 +118,37 @@ class LLMOrchestrator:
             "results": results,
         }
         self.round_history.append(round_data)
-        if len(self.round_history) > 1000:
-            self.round_history = self.round_history[-1000:]
-        return results
+        return results, top_index
+
+    def _group_by_url(self) -> Tuple[List[ModelClient], List[int]]:
+        """Return one leader client per URL and each client's leader index."""
+
+        leaders: List[ModelClient] = []
+        slots: List[int] = []
+        index_by_url: Dict[Any, int] = {}
+        for client in self.clients:
+            key = getattr(client, "url", None) or id(client)
+            slot = index_by_url.get(key)
+            if slot is None:
+                slot = index_by_url[key] = len(leaders)
+                leaders.append(client)
+            slots.append(slot)
+        return leaders, slots
+
+    def _record_shared_call(self, client: ModelClient, response: Any) -> None:
+        """Credit a client whose reply came from its URL leader's request."""
+
+        if not hasattr(client, "total_calls"):
+            return
+        client.total_calls += 1
+        if isinstance(response, Exception):
+            client.error_count += 1
+        elif response is not None:
+            client.successful_calls += 1
+            client._update_latency(response.latency_ms)
 
     def _build_prompt(self, context: RoundContext) -> str:
-        return (
-            "You are competing in a public Novelty Championship.\n"
-            "Respond with exactly ONE item starting with:\n"
-            "TRADE: <pair, direction, entry, exit, expected X% profit, 3-line python stub>\n"
-            "or\n"
-            "PAPER: <Title> — 300 words abstract with a concrete mechanism and evaluation path.\n\n"
-            f"Context JSON: {{\n    \"symbol\": \"{context.symbol}\",\n"
-            f"    \"price\": {context.price},\n"
-            f"    \"sol_tips_proxy\": {context.sol_tips_proxy},\n"
-            f"    \"sol_whales_proxy\": {context.sol_whales_proxy},\n"
-            f"    \"trending_source\": \"{context.trending_source}\",\n"
-            f"    \"timestamp\": {context.timestamp}\n}}\n\n"
-            "Rules: no filler, no preamble, one output only."
-        )
+        return _PROMPT_TEMPLATE % _PROMPT_FIELDS(context)
 
     def _handle_error(self, model_name: str, error: Exception) -> Dict[str, Any]:
         return {
@@ -117,7 +182,9 @@ class LLMOrchestrator:
         total_calls = sum(client.total_calls for client in self.clients)
         error_rate = 1.0 - (successful_calls / total_calls) if total_calls else 0.0
         avg_latency_values = [client.avg_latency for client in self.clients if client.avg_latency]
-        avg_latency = float(np.mean(avg_latency_values)) if avg_latency_values else 0.0
+        avg_latency = (
+            sum(avg_latency_values) / len(avg_latency_values) if avg_latency_values else 0.0
+        )
 
         return {
             "active_clients": len([c for c in self.clients if c.is_healthy()]),
@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from .tokens import lower_tokens
 
 
 @dataclass
@@ -7,12 +10,16 @@ class ImpactResult:
     rationale: str
 
 
+_IMPACT_KEYWORDS = frozenset({"protocol", "deployment", "experiment", "backtest"})
+
+
 class ImpactEngine:
     """Estimate potential impact for a research signal."""
 
-    def score(self, text: str) -> ImpactResult:
-        keywords = {"protocol", "deployment", "experiment", "backtest"}
-        hits = sum(1 for word in text.lower().split() if word in keywords)
+    def score(self, text: str, tokens: Optional[Sequence[str]] = None) -> ImpactResult:
+        if tokens is None:
+            tokens = lower_tokens(text)
+        hits = sum(map(_IMPACT_KEYWORDS.__contains__, tokens))
         score = min(hits / 4.0, 1.0)
         rationale = "Contains operational language" if hits else "Insufficient implementation detail"
         return ImpactResult(score=score, rationale=rationale)
@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from .tokens import lower_tokens
 
 
 @dataclass
@@ -10,8 +13,10 @@ class NoveltyResult:
 class NoveltyEngine:
     """Score model outputs for novelty."""
 
-    def score(self, text: str) -> NoveltyResult:
-        tokens = len(text.split())
-        score = min(tokens / 150.0, 1.0)
+    def score(self, text: str, tokens: Optional[Sequence[str]] = None) -> NoveltyResult:
+        # Lower-casing never changes whitespace, so the shared tokens count the same.
+        if tokens is None:
+            tokens = lower_tokens(text)
+        score = min(len(tokens) / 150.0, 1.0)
         rationale = "High token count implies richer signal" if score > 0.7 else "Limited detail"
         return NoveltyResult(score=score, rationale=rationale)
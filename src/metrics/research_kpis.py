@@ -1,13 +1,23 @@
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import time
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 
-import numpy as np
+from .tokens import lower_tokens
+
+BUZZWORDS = frozenset({"mev", "zkp", "defi", "ai", "quantum"})
+ENSEMBLE_WINDOW = 1000
+# Signals older than this (relative to the newest one) leave the prefix-sum
+# index; queries reaching further back fall back to scanning ``signals``.
+INDEX_HORIZON_HOURS = 7 * 24
+_REBASE_MIN_DROPPED = 64
 
 
 @dataclass
 class ResearchSignal:
-    timestamp: datetime
+    timestamp: float  # Unix seconds, as returned by time.time()
     model: str
     novelty_score: float
     impact_score: float
@@ -18,17 +28,90 @@ class ResearchSignal:
     publication_score: float = 0.0
 
 
+class _PrefixIndex:
+    """Timestamps with running sums, answering trailing windows by bisection."""
+
+    __slots__ = ("timestamps", "prefixes", "start", "last_descent", "dropped_max")
+
+    def __init__(self, columns: int) -> None:
+        self.timestamps: List[float] = []
+        self.prefixes: List[List[float]] = [[0.0] for _ in range(columns)]
+        self.start = 0  # first live position; earlier entries await rebasing
+        self.last_descent = -1  # position of the newest out-of-order timestamp
+        self.dropped_max = float("-inf")
+
+    def append(self, timestamp: float, *values: float) -> None:
+        timestamps = self.timestamps
+        if timestamps and timestamp < timestamps[-1]:
+            self.last_descent = len(timestamps)
+        timestamps.append(timestamp)
+        for prefix, value in zip(self.prefixes, values):
+            prefix.append(prefix[-1] + value)
+
+    def trim(self, threshold: float) -> None:
+        timestamps = self.timestamps
+        start = self.start
+        while start < len(timestamps) and timestamps[start] < threshold:
+            if timestamps[start] > self.dropped_max:
+                self.dropped_max = timestamps[start]
+            start += 1
+        self.start = start
+        if start >= _REBASE_MIN_DROPPED and 2 * start > len(timestamps):
+            self._rebase()
+
+    def _rebase(self) -> None:
+        # Drop the dead head and re-zero the sums so they stay small.
+        start = self.start
+        del self.timestamps[:start]
+        for prefix in self.prefixes:
+            base = prefix[start]
+            prefix[:] = [value - base for value in prefix[start:]]
+        self.last_descent -= start
+        self.start = 0
+
+    def window(self, cutoff: float) -> Optional[Tuple[int, List[float]]]:
+        """Return ``(count, sums)`` for timestamps >= ``cutoff``, or None if unsorted.
+
+        Also None when ``cutoff`` reaches entries already trimmed away.
+        """
+
+        # A descent at ``start`` pairs with a trimmed entry, so what is left is sorted.
+        if self.last_descent > self.start or cutoff <= self.dropped_max:
+            return None
+        first = bisect_left(self.timestamps, cutoff, lo=self.start)
+        count = len(self.timestamps) - first
+        return count, [prefix[-1] - prefix[first] for prefix in self.prefixes]
+
+
 class ResearchKPIEngine:
     """Track ensemble performance for research discovery."""
 
-    def __init__(self, significance_threshold: float = 0.05) -> None:
+    def __init__(
+        self,
+        significance_threshold: float = 0.05,
+        index_horizon_hours: float = INDEX_HORIZON_HOURS,
+    ) -> None:
         self.significance_threshold = significance_threshold
         self.signals: List[ResearchSignal] = []
         self.confirmed_signals: List[ResearchSignal] = []
-
-    def add_signal(self, signal: ResearchSignal) -> None:
+        # Aggregates maintained by add_signal so metric scrapes avoid full scans.
+        # Prefix sums answer recent windows by bisection and are trimmed to the
+        # horizon. Out-of-order arrivals fall back to scanning until they age out.
+        self._index_horizon = index_horizon_hours * 3600
+        self._newest_timestamp = float("-inf")
+        self._signal_index = _PrefixIndex(2)  # novelty, impact
+        self._confirmed_index = _PrefixIndex(1)  # publication-ready flags
+        self._ensemble_window: Deque[Tuple[str, float]] = deque()
+        self._model_totals: Dict[str, List[float]] = {}
+
+    def add_signal(
+        self, signal: ResearchSignal, tokens: Optional[Sequence[str]] = None
+    ) -> None:
         self.signals.append(signal)
-        signal.publication_score = self._calculate_publication_score(signal)
+        signal.publication_score = self._calculate_publication_score(signal, tokens)
+
+        self._signal_index.append(signal.timestamp, signal.novelty_score, signal.impact_score)
+        self._track_ensemble(signal.model, signal.novelty_score + signal.impact_score)
 
         if (
             signal.novelty_score > 0.8
@@ -37,8 +120,31 @@ class ResearchKPIEngine:
         ):
             signal.confirmation_status = "CONFIRMED"
             self.confirmed_signals.append(signal)
-
-    def _calculate_publication_score(self, signal: ResearchSignal) -> float:
+            self._confirmed_index.append(signal.timestamp, signal.publication_score > 0.8)
+
+        if signal.timestamp > self._newest_timestamp:
+            self._newest_timestamp = signal.timestamp
+            threshold = signal.timestamp - self._index_horizon
+            self._signal_index.trim(threshold)
+            self._confirmed_index.trim(threshold)
+
+    def _track_ensemble(self, model: str, score: float) -> None:
+        self._ensemble_window.append((model, score))
+        entry = self._model_totals.setdefault(model, [0.0, 0])
+        entry[0] += score
+        entry[1] += 1
+        if len(self._ensemble_window) > ENSEMBLE_WINDOW:
+            old_model, old_score = self._ensemble_window.popleft()
+            old_entry = self._model_totals[old_model]
+            old_entry[1] -= 1
+            if old_entry[1]:
+                old_entry[0] -= old_score
+            else:
+                del self._model_totals[old_model]
+
+    def _calculate_publication_score(
+        self, signal: ResearchSignal, tokens: Optional[Sequence[str]] = None
+    ) -> float:
         novelty_weight = 0.4
         impact_weight = 0.3
         evidence_weight = 0.2
@@ -46,9 +152,8 @@ class ResearchKPIEngine:
 
         evidence_strength = min(len(signal.text) / 500, 1.0)
 
-        buzzwords = {"mev", "zkp", "defi", "ai", "quantum"}
-        words = signal.text.lower().split()
-        buzzword_count = sum(1 for word in words if word in buzzwords)
+        words = lower_tokens(signal.text) if tokens is None else tokens
+        buzzword_count = sum(map(BUZZWORDS.__contains__, words))
         specificity = 1.0 - min(buzzword_count / max(len(words), 1), 0.5)
 
         return (
@@ -59,27 +164,24 @@ class ResearchKPIEngine:
         )
 
     def get_signal_discovery_rate(self, window_hours: int = 24) -> Dict[str, float]:
-        cutoff = datetime.now() - timedelta(hours=window_hours)
-        recent_signals = [s for s in self.signals if s.timestamp >= cutoff]
-        recent_confirmed = [s for s in self.confirmed_signals if s.timestamp >= cutoff]
-
-        total_signals = len(recent_signals)
-        confirmed_count = len(recent_confirmed)
-
-        novelty_avg = (
-            float(np.mean([s.novelty_score for s in recent_signals]))
-            if recent_signals
-            else 0.0
-        )
-        impact_avg = (
-            float(np.mean([s.impact_score for s in recent_signals]))
-            if recent_signals
-            else 0.0
-        )
-
-        publication_ready = len(
-            [s for s in recent_confirmed if s.publication_score > 0.8]
-        )
+        cutoff = time.time() - window_hours * 3600
+        recent = self._signal_index.window(cutoff)
+        confirmed = self._confirmed_index.window(cutoff)
+        if recent is not None and confirmed is not None:
+            total_signals, (novelty_total, impact_total) = recent
+            confirmed_count, (publication_total,) = confirmed
+            publication_ready = round(publication_total)
+        else:
+            (
+                total_signals,
+                novelty_total,
+                impact_total,
+                confirmed_count,
+                publication_ready,
+            ) = self._scan_window(cutoff)
+
+        novelty_avg = novelty_total / total_signals if total_signals else 0.0
+        impact_avg = impact_total / total_signals if total_signals else 0.0
 
         return {
             "signals_per_hour": total_signals / window_hours,
@@ -89,36 +191,52 @@ class ResearchKPIEngine:
             "publication_ready": publication_ready,
         }
 
+    def _scan_window(self, cutoff: float) -> Tuple[int, float, float, int, int]:
+        total_signals = 0
+        novelty_total = 0.0
+        impact_total = 0.0
+        for signal in self.signals:
+            if signal.timestamp >= cutoff:
+                total_signals += 1
+                novelty_total += signal.novelty_score
+                impact_total += signal.impact_score
+
+        confirmed_count = 0
+        publication_ready = 0
+        for signal in self.confirmed_signals:
+            if signal.timestamp >= cutoff:
+                confirmed_count += 1
+                if signal.publication_score > 0.8:
+                    publication_ready += 1
+
+        return total_signals, novelty_total, impact_total, confirmed_count, publication_ready
+
     def get_ensemble_metrics(self) -> Dict[str, float]:
         if not self.signals:
             return {}
 
-        recent = self.signals[-1000:]
-        models = {signal.model for signal in recent}
-        model_scores = {}
-        for model in models:
-            model_signals = [s for s in recent if s.model == model]
-            if model_signals:
-                model_scores[model] = float(
-                    np.mean([s.novelty_score + s.impact_score for s in model_signals])
-                )
+        model_scores = {
+            model: total / count for model, (total, count) in self._model_totals.items()
+        }
 
         scores = list(model_scores.values())
-        divergence = float(np.var(scores)) if scores else 0.0
+        mean_score = sum(scores) / len(scores)
+        divergence = sum((score - mean_score) ** 2 for score in scores) / len(scores)
 
         return {
             "ensemble_divergence": divergence,
-            "top_performer": max(model_scores, key=model_scores.get) if model_scores else "",
-            "active_models": len(models),
-            "performance_gap": (max(scores) - min(scores)) if scores else 0.0,
+            "top_performer": max(model_scores, key=model_scores.get),
+            "active_models": len(model_scores),
+            "performance_gap": max(scores) - min(scores),
         }
 
     def generate_research_abstract(self, signal: ResearchSignal) -> str:
         if signal.publication_score < 0.7:
             return ""
 
+        published = datetime.fromtimestamp(signal.timestamp)
         return (
-            f"RESEARCH ABSTRACT: {signal.timestamp:%Y-%m-%d %H:%M}\n\n"
+            f"RESEARCH ABSTRACT: {published:%Y-%m-%d %H:%M}\n\n"
             f"Title: Automated Discovery of {signal.track.upper()} Signal via LLM Ensemble\n\n"
             "Abstract: We present a novel {track} signal identified through large language model "
             "ensemble analysis. The signal demonstrates exceptional novelty and potential impact.\n"
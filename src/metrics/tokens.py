@@ -0,0 +1,11 @@
+from typing import List
+
+
+def lower_tokens(text: str) -> List[str]:
+    """Lower-cased whitespace tokens of ``text``, shared by the scoring engines.
+
+    Callers scoring one text with several engines tokenize once and pass the
+    result to each ``score`` call.
+    """
+
+    return text.lower().split()
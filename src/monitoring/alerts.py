@@ -1,19 +1,36 @@
 import logging
+from functools import lru_cache
 from typing import Any, Dict
 
-import requests
-
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _http_session() -> Any:
+    """Return the pooled session used for webhook posts, created on first alert.
+
+    Alerts arrive in bursts; reusing the session keeps the webhook's TCP/TLS
+    connection alive instead of handshaking for every post.
+    """
+
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def send_alert(payload: Dict[str, Any]) -> None:
     if not settings.alert_webhook:
         logger.warning("Alert webhook not configured; dropping alert")
         return
     try:
-        response = requests.post(settings.alert_webhook, json=payload, timeout=5)
+        response = _http_session().post(settings.alert_webhook, json=payload, timeout=5)
         response.raise_for_status()
     except Exception as exc:
         logger.error("Failed to send alert: %s", exc)
@@ -1,12 +1,27 @@
+import asyncio
 import hashlib
+import heapq
 import json
 import os
+import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from config.settings import settings
 
+_CHUNK_BYTES = 1 << 16
+
+
+def _current_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_UMASK = _current_umask()
+
 
 class MerkleLogger:
     """Persist round outputs with Merkle root tracking."""
@@ -14,34 +29,122 @@ class MerkleLogger:
     def __init__(self, base_path: str) -> None:
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
-        self._current_root = ""
+        self._current_root = b""
+        # Min-heap of (mtime, path) so pruning never re-stats the archive.
+        # Rewriting an existing digest leaves a stale heap entry behind; the
+        # latest mtime per path lives in _archive_times and wins on pop.
+        self._archive_times: Dict[Path, float] = {
+            path: path.stat().st_mtime for path in self.base_path.glob("*.json")
+        }
+        self._archive_heap: List[Tuple[float, Path]] = [
+            (mtime, path) for path, mtime in self._archive_times.items()
+        ]
+        heapq.heapify(self._archive_heap)
 
-    def log_round(self, context: Any, results: List[Dict[str, Any]]) -> str:
+    async def log_round(self, context: Any, results: List[Dict[str, Any]]) -> str:
+        # Contexts that carry their own cached encoding (RoundContext) are
+        # spliced in verbatim instead of being walked again.
+        to_json = getattr(context, "to_json", None)
+        context_json = to_json() if callable(to_json) else None
         payload = {
             "timestamp": datetime.utcnow().isoformat(),
-            "context": getattr(context, "__dict__", context),
+            "context": getattr(context, "__dict__", context) if context_json is None else None,
             "results": results,
         }
-        blob = json.dumps(payload, sort_keys=True).encode("utf-8")
-        digest = hashlib.sha256(blob).hexdigest()
+        # Disk work runs off the event loop; heap and root bookkeeping stay on
+        # it so concurrent rounds never mutate shared state from a thread.
+        digest, path = await asyncio.to_thread(self._write_file, payload, context_json)
         self._current_root = self._combine_hash(self._current_root, digest)
-        self._write_file(digest, blob)
-        return self._current_root
+        self._track_archive(path)
+        evicted = self._prune_archives()
+        if evicted:
+            await asyncio.to_thread(self._unlink_archives, evicted)
+        return self.get_current_root()
+
+    def _combine_hash(self, left: bytes, right: bytes) -> bytes:
+        return hashlib.sha256(left + right).digest()
+
+    def _write_file(
+        self, payload: Dict[str, Any], context_json: Optional[str] = None
+    ) -> Tuple[bytes, Path]:
+        """Stream ``payload`` as JSON to disk, hashing it on the way.
+
+        The archive name is the content digest, which is only known once the
+        last chunk is written, so the JSON goes to a temporary file first.
+        ``context_json``, when given, replaces the encoding of the ``context``
+        key; the bytes match what ``json.dumps(sort_keys=True)`` would emit.
+        """
+        hasher = hashlib.sha256()
+        encoder = json.JSONEncoder(sort_keys=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.base_path, suffix=".tmp")
+        try:
+            # mkstemp creates 0600; give archives the mode a plain open()
+            # would have so other readers and backup jobs keep access.
+            os.fchmod(fd, 0o666 & ~_UMASK)
+            with os.fdopen(fd, "wb") as handle:
+                pending: List[str] = []
+                size = 0
+                for chunk in self._iter_chunks(encoder, payload, context_json):
+                    pending.append(chunk)
+                    size += len(chunk)
+                    if size >= _CHUNK_BYTES:
+                        data = "".join(pending).encode("utf-8")
+                        hasher.update(data)
+                        handle.write(data)
+                        pending.clear()
+                        size = 0
+                data = "".join(pending).encode("utf-8")
+                hasher.update(data)
+                handle.write(data)
+            digest = hasher.digest()
+            path = self.base_path / f"{digest.hex()}.json"
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return digest, path
+
+    @staticmethod
+    def _iter_chunks(
+        encoder: json.JSONEncoder, payload: Dict[str, Any], context_json: Optional[str]
+    ) -> Iterator[str]:
+        if context_json is None:
+            yield from encoder.iterencode(payload)
+            return
+        separator = "{"
+        for key in sorted(payload):
+            yield separator
+            yield json.dumps(key)
+            yield ": "
+            if key == "context":
+                yield context_json
+            else:
+                yield from encoder.iterencode(payload[key])
+            separator = ", "
+        yield "}"
 
-    def _combine_hash(self, left: str, right: str) -> str:
-        material = (left + right).encode("utf-8")
-        return hashlib.sha256(material).hexdigest()
+    def _track_archive(self, path: Path) -> None:
+        written_at = time.time()
+        self._archive_times[path] = written_at
+        heapq.heappush(self._archive_heap, (written_at, path))
 
-    def _write_file(self, digest: str, blob: bytes) -> None:
-        path = self.base_path / f"{digest}.json"
-        path.write_bytes(blob)
-        self._prune_archives()
+    def _prune_archives(self) -> List[Path]:
+        evicted: List[Path] = []
+        while len(self._archive_times) > settings.archive_cap:
+            written_at, path = heapq.heappop(self._archive_heap)
+            if self._archive_times.get(path) != written_at:
+                continue
+            del self._archive_times[path]
+            evicted.append(path)
+        if len(self._archive_heap) > 2 * len(self._archive_times) + 64:
+            self._archive_heap = [(mtime, path) for path, mtime in self._archive_times.items()]
+            heapq.heapify(self._archive_heap)
+        return evicted
 
-    def _prune_archives(self) -> None:
-        files = sorted(self.base_path.glob("*.json"), key=os.path.getmtime)
-        excess = len(files) - settings.archive_cap
-        for file in files[: max(excess, 0)]:
-            file.unlink(missing_ok=True)
+    @staticmethod
+    def _unlink_archives(paths: List[Path]) -> None:
+        for path in paths:
+            path.unlink(missing_ok=True)
 
     def get_current_root(self) -> str:
-        return self._current_root
+        return self._current_root.hex()
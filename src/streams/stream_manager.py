@@ -1,20 +1,36 @@
 import asyncio
+import contextlib
+import ssl
+import sys
 import time
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Dict, Optional
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from websockets import connect
+from websockets.exceptions import ConnectionClosedOK
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamHealth:
-    last_message: float = 0.0
+    last_message: float = 0.0  # time.monotonic() of the latest frame
     message_count: int = 0
     error_count: int = 0
     reconnect_count: int = 0
     total_downtime: float = 0.0
 
 
+@lru_cache(maxsize=1)
+def _tls_context() -> ssl.SSLContext:
+    # One context for every reconnect so the CA bundle is loaded once rather
+    # than on each connect.
+    return ssl.create_default_context()
+
+
+_CLOSED, _OPEN, _HALF_OPEN = 0, 1, 2
+_STATE_NAMES = ("CLOSED", "OPEN", "HALF_OPEN")
+
+
 class CircuitBreaker:
     """Simple circuit breaker implementation to protect external services."""
 
@@ -22,41 +38,118 @@ class CircuitBreaker:
         self.max_failures = max_failures
         self.timeout = timeout
         self.failures = 0
-        self.last_failure = 0.0
-        self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+        self.last_failure = 0.0  # time.time() of the latest failure
+        # One small-int state plus a monotonic deadline; while the deadline is
+        # in the future the breaker is open and ``can_execute`` is one compare.
+        self._state = _CLOSED
+        self._open_until = 0.0
+
+    @property
+    def state(self) -> str:
+        return _STATE_NAMES[self._state]
+
+    @state.setter
+    def state(self, name: str) -> None:
+        self._state = _STATE_NAMES.index(name)
+        if self._state == _OPEN:
+            # Stay open until ``timeout`` seconds after the last failure.
+            elapsed = time.time() - self.last_failure
+            self._open_until = time.monotonic() + self.timeout - elapsed
 
     def can_execute(self) -> bool:
-        if self.state == "OPEN":
-            if time.time() - self.last_failure > self.timeout:
-                self.state = "HALF_OPEN"
-                return True
+        if self._state != _OPEN:
+            return True
+        if time.monotonic() < self._open_until:
             return False
+        self._state = _HALF_OPEN
         return True
 
     def on_success(self) -> None:
-        self.state = "CLOSED"
+        self._state = _CLOSED
         self.failures = 0
 
     def on_failure(self) -> None:
         self.failures += 1
         self.last_failure = time.time()
         if self.failures >= self.max_failures:
-            self.state = "OPEN"
+            self._state = _OPEN
+            self._open_until = time.monotonic() + self.timeout
 
 
 class StreamManager:
     """Manage resilient streaming connections with health metrics."""
 
+    queue_size = 1024
+    metrics_ttl_seconds = 0.25
+    downtime_grace_seconds = 30.0
+    downtime_sample_seconds = 1.0
+    # Lets pongs and handler replies queue in the transport instead of
+    # hitting websockets' 64 KiB drain threshold.
+    write_limit = 2**20
+    open_timeout_seconds = 5.0
+
+    @staticmethod
+    def install_uvloop() -> bool:
+        """Make uvloop the event loop policy when it is available.
+
+        Call before ``asyncio.run`` in production runners; returns ``False``
+        (leaving the default loop in place) on Windows or without uvloop.
+        """
+
+        if sys.platform == "win32":
+            return False
+        try:
+            import uvloop  # type: ignore
+        except ImportError:
+            return False
+        uvloop.install()
+        return True
+
     def __init__(self, circuit_breaker: Optional[CircuitBreaker] = None) -> None:
         self.health = StreamHealth()
         self.circuit_breaker = circuit_breaker or CircuitBreaker()
         self._is_running = False
+        # (taken_at, breaker state, version, metrics); polled per request.
+        self._metrics_snapshot: Tuple[float, str, int, Dict[str, Any]] = (0.0, "", 0, {})
+        self._metrics_version = 0
+        # Live connection and its loop, so stop() can close a silent socket
+        # instead of waiting for the next frame or the ping timeout.
+        self._ws: Any = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._close_task: Optional["asyncio.Future[Any]"] = None
 
     async def managed_websocket_stream(
-        self, url: str, message_handler: Callable[[str], Awaitable[None]],
+        self,
+        url: str,
+        message_handler: Callable[[str], Awaitable[None]],
+        *,
+        compress: bool = False,
+    ) -> None:
+        """Stream ``url`` into ``message_handler`` until :meth:`stop` is called.
+
+        permessage-deflate is off by default: small, high-rate frames such as
+        trade ticks cost more to inflate than they save on the wire. Pass
+        ``compress=True`` for feeds with large, compressible payloads.
+        """
+
+        self._loop = asyncio.get_running_loop()
+        sampler = asyncio.create_task(self._downtime_sampler())
+        try:
+            await self._stream(url, message_handler, compress)
+        finally:
+            self._loop = None
+            sampler.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await sampler
+
+    async def _stream(
+        self, url: str, message_handler: Callable[[str], Awaitable[None]], compress: bool,
     ) -> None:
         backoff = 1
         max_backoff = 32
+        now = time.monotonic
+        health = self.health
+        tls = {"ssl": _tls_context()} if url.startswith("wss://") else {}
 
         while self._is_running:
             if not self.circuit_breaker.can_execute():
@@ -64,48 +157,158 @@ class StreamManager:
                 continue
 
             try:
-                async with connect(url, ping_interval=20, ping_timeout=10) as ws:
-                    self.health.reconnect_count += 1
+                async with connect(
+                    url,
+                    ping_interval=20,
+                    ping_timeout=10,
+                    compression="deflate" if compress else None,
+                    write_limit=self.write_limit,
+                    open_timeout=self.open_timeout_seconds,
+                    **tls,
+                ) as ws:
+                    self._ws = ws
+                    health.reconnect_count += 1
                     backoff = 1
 
-                    async for message in ws:
-                        if not self._is_running:
-                            break
+                    # The reader only buffers frames; handler latency is paid by
+                    # the consumer task so slow handlers no longer stall the
+                    # socket until the queue itself fills up.
+                    queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=self.queue_size)
+                    consumer = asyncio.create_task(self._consume(ws, queue, message_handler))
+                    put_nowait = queue.put_nowait
+                    try:
+                        while self._is_running and not consumer.done():
+                            try:
+                                batch = await self._drain_ready(ws)
+                            except ConnectionClosedOK:
+                                break
 
-                        self.health.last_message = time.time()
-                        self.health.message_count += 1
+                            # Counters are written once per batch, not per frame,
+                            # and stay current for health scrapes.
+                            health.last_message = now()
+                            health.message_count += len(batch)
 
-                        try:
-                            await message_handler(message)
-                            self.circuit_breaker.on_success()
-                        except Exception:
-                            self.health.error_count += 1
-                            self.circuit_breaker.on_failure()
-                            break
+                            for message in batch:
+                                try:
+                                    put_nowait(message)
+                                except asyncio.QueueFull:
+                                    await queue.put(message)
+                        if self._is_running and not consumer.done():
+                            # Server closed the stream: let buffered frames finish.
+                            await queue.put(None)
+                            await consumer
+                    finally:
+                        self._ws = None
+                        consumer.cancel()
+                        with contextlib.suppress(asyncio.CancelledError):
+                            await consumer
 
             except Exception:
-                self.health.error_count += 1
+                health.error_count += 1
                 self.circuit_breaker.on_failure()
                 await asyncio.sleep(backoff)
                 backoff = min(backoff * 2, max_backoff)
 
+    @staticmethod
+    async def _drain_ready(ws: Any, max_batch: int = 32) -> List[str]:
+        """Wait for one frame, then take any already-buffered frames with it.
+
+        ``recv`` returns without suspending while the protocol's ``messages``
+        buffer is non-empty, so a burst costs one event-loop wakeup.
+        """
+
+        batch = [await ws.recv()]
+        buffered = getattr(ws, "messages", None)
+        while buffered and len(batch) < max_batch:
+            batch.append(await ws.recv())
+        return batch
+
+    async def _downtime_sampler(self) -> None:
+        while True:
+            await asyncio.sleep(self.downtime_sample_seconds)
+            self._sample_downtime(time.monotonic(), self.downtime_sample_seconds)
+
+    def _sample_downtime(self, now: float, interval: float) -> None:
+        """Accrue the part of the last ``interval`` spent past the grace period."""
+
+        if self.health.last_message:
+            overdue = now - self.health.last_message - self.downtime_grace_seconds
+            if overdue > 0:
+                self.health.total_downtime += min(overdue, interval)
+
+    async def _consume(
+        self,
+        ws: Any,
+        queue: "asyncio.Queue[Optional[str]]",
+        message_handler: Callable[[str], Awaitable[None]],
+    ) -> None:
+        while True:
+            message = await queue.get()
+            if message is None:
+                return
+            try:
+                await message_handler(message)
+                self.circuit_breaker.on_success()
+            except Exception:
+                self.health.error_count += 1
+                self.circuit_breaker.on_failure()
+                # Unblock a reader waiting on a full queue, then drop the
+                # connection so the reader loop reconnects.
+                while not queue.empty():
+                    queue.get_nowait()
+                await ws.close()
+                return
+
     def get_health_metrics(self) -> Dict[str, Any]:
+        """Return stream health, reusing a snapshot younger than the TTL."""
+
+        now = time.monotonic()
+        state = self.circuit_breaker.state
+        taken_at, cached_state, version, snapshot = self._metrics_snapshot
+        if (
+            snapshot
+            and now - taken_at < self.metrics_ttl_seconds
+            and cached_state == state
+            and version == self._metrics_version
+        ):
+            return snapshot
+
         downtime = 0.0
+        last_message_at = 0.0
         if self.health.last_message:
-            downtime = max(0.0, time.time() - self.health.last_message - 30)
-            self.health.total_downtime += downtime
+            silence = now - self.health.last_message
+            downtime = max(0.0, silence - self.downtime_grace_seconds)
+            last_message_at = time.time() - silence
 
-        return {
+        snapshot = {
             "message_count": self.health.message_count,
             "error_count": self.health.error_count,
             "reconnect_count": self.health.reconnect_count,
+            "last_message_at": last_message_at,
             "current_downtime": downtime,
             "total_downtime": self.health.total_downtime,
-            "circuit_breaker_state": self.circuit_breaker.state,
+            "circuit_breaker_state": state,
         }
+        self._metrics_snapshot = (now, state, self._metrics_version, snapshot)
+        return snapshot
 
     def start(self) -> None:
         self._is_running = True
 
     def stop(self) -> None:
         self._is_running = False
+        self._metrics_version += 1
+        ws, loop = self._ws, self._loop
+        if ws is None or loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._close_task = loop.create_task(ws.close(code=1000))
+        else:
+            loop.call_soon_threadsafe(self._schedule_close, ws)
+
+    def _schedule_close(self, ws: Any) -> None:
+        self._close_task = asyncio.ensure_future(ws.close(code=1000))
@@ -2,6 +2,7 @@ import asyncio
 
 import pytest
 
+from src.llm.model_client import ModelClient, ModelResponse
 from src.llm.orchestrator import LLMOrchestrator, RoundContext
 
 
@@ -41,3 +42,116 @@ async def test_orchestrator_handles_timeouts() -> None:
     results = await orchestrator.execute_round(context)
     assert results[0]["success"] is False
     await orchestrator.close()
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_shares_one_request_per_url() -> None:
+    orchestrator = LLMOrchestrator()
+    calls = []
+
+    class EchoClient:
+        def __init__(self, name: str, url: str) -> None:
+            self.name = name
+            self.url = url
+
+        async def generate(self, prompt: str, round_id: str):
+            calls.append(self.url)
+            return ModelResponse(text=f"from {self.name}", latency_ms=1.0)
+
+    orchestrator.clients = [
+        EchoClient("a", "http://shared"),
+        EchoClient("b", "http://other"),
+        EchoClient("c", "http://shared"),
+    ]
+    context = RoundContext(
+        symbol="BTCUSDT",
+        price=100.0,
+        sol_tips_proxy=1.0,
+        sol_whales_proxy=2.0,
+        trending_source="test",
+        timestamp=0.0,
+        round_id="round_test",
+    )
+    results = await orchestrator.execute_round(context)
+    assert sorted(calls) == ["http://other", "http://shared"]
+    assert [result["model"] for result in results] == ["a", "b", "c"]
+    assert results[2]["text"] == "from a"
+
+
+@pytest.mark.asyncio
+async def test_shared_responses_update_sibling_client_stats() -> None:
+    orchestrator = LLMOrchestrator()
+
+    class StubClient(ModelClient):
+        def __init__(self, name: str, url: str, fail: bool = False) -> None:
+            super().__init__(name, url)
+            self.fail = fail
+
+        async def generate(self, prompt: str, round_id: str):
+            self.total_calls += 1
+            if self.fail:
+                self.error_count += 1
+                raise RuntimeError("backend down")
+            self.successful_calls += 1
+            self._update_latency(5.0)
+            return ModelResponse(text="ok", latency_ms=5.0)
+
+    orchestrator.clients = [
+        StubClient("a", "http://shared"),
+        StubClient("b", "http://shared"),
+        StubClient("c", "http://down", fail=True),
+        StubClient("d", "http://down"),
+    ]
+    context = RoundContext(
+        symbol="BTCUSDT",
+        price=100.0,
+        sol_tips_proxy=1.0,
+        sol_whales_proxy=2.0,
+        trending_source="test",
+        timestamp=0.0,
+        round_id="round_test",
+    )
+    await orchestrator.execute_round(context)
+    leader, sibling, _, failed_sibling = orchestrator.clients
+    assert (sibling.total_calls, sibling.successful_calls, sibling.avg_latency) == (
+        leader.total_calls,
+        leader.successful_calls,
+        leader.avg_latency,
+    )
+    assert (failed_sibling.total_calls, failed_sibling.error_count) == (1, 1)
+    assert failed_sibling.successful_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_execute_round_with_top_returns_longest_text_index() -> None:
+    orchestrator = LLMOrchestrator()
+
+    class EchoClient:
+        def __init__(self, name: str, text: str) -> None:
+            self.name = name
+            self.url = f"http://{name}"
+            self.text = text
+
+        async def generate(self, prompt: str, round_id: str):
+            return ModelResponse(text=self.text, latency_ms=1.0)
+
+    orchestrator.clients = [
+        EchoClient("a", "short"),
+        EchoClient("b", "the longest reply"),
+        EchoClient("c", "the longest text!"),
+    ]
+    context = RoundContext(
+        symbol="BTCUSDT",
+        price=100.0,
+        sol_tips_proxy=1.0,
+        sol_whales_proxy=2.0,
+        trending_source="test",
+        timestamp=0.0,
+        round_id="round_test",
+    )
+    results, top_index = await orchestrator.execute_round_with_top(context)
+    assert top_index == 1
+    assert results[top_index]["text"] == max((r["text"] for r in results), key=len)
+
+    orchestrator.clients = []
+    assert await orchestrator.execute_round_with_top(context) == ([], -1)
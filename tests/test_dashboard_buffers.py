@@ -0,0 +1,19 @@
+from src.api.dashboard import NumpyRingBuffer
+
+
+def test_ring_buffer_keeps_latest_rows_in_order() -> None:
+    buffer = NumpyRingBuffer(capacity=3, width=2)
+    assert len(buffer) == 0
+    for index in range(5):
+        buffer.append((float(index), float(index) * 10))
+
+    assert len(buffer) == 3
+    assert buffer.view().tolist() == [[2.0, 20.0], [3.0, 30.0], [4.0, 40.0]]
+    assert buffer.last()[1] == 40.0
+
+
+def test_ring_buffer_view_is_zero_copy_until_wrapped() -> None:
+    buffer = NumpyRingBuffer(capacity=4, width=1)
+    buffer.append((1.0,))
+    buffer.append((2.0,))
+    assert buffer.view().base is buffer.buf
@@ -114,3 +114,50 @@ def test_summary_includes_profit_relay_when_requested(sample_records):
     ]
     assert summary["profit_relay_total"] == Decimal("489.50")
 
+
+def test_vectorised_per_capita_matches_record_rounding():
+    records = [
+        GDPRecord(country="Tieland", year=2019, gdp_usd=Decimal("169883572.23"), population=846),
+        GDPRecord(country="Tieland", year=2020, gdp_usd=Decimal("1.005"), population=1),
+        GDPRecord(country="Tieland", year=2021, gdp_usd=Decimal("1"), population=8),
+    ]
+    analyzer = build_analyzer(records)
+    assert analyzer.per_capita_series("Tieland") == [
+        (record.year, record.gdp_per_capita()) for record in records
+    ]
+    assert analyzer.dataset.per_capita_array("Tieland")[2] == pytest.approx(0.125)
+
+
+def test_series_are_memoised_but_returned_as_copies(sample_records):
+    analyzer = build_analyzer(sample_records)
+    first = analyzer.growth_rates("Exampleland")
+    first.clear()
+    assert analyzer.growth_rates("Exampleland") == [
+        (2021, Decimal("0.0396")),
+        (2022, Decimal("0.0630")),
+    ]
+    assert analyzer.dataset.per_capita_cents("Exampleland") is analyzer.dataset.per_capita_cents(
+        "Exampleland"
+    )
+
+
+def test_record_per_capita_cents_are_exact_integers():
+    record = GDPRecord(country="Tieland", year=2020, gdp_usd=Decimal("1260000000000"), population=50500000)
+    assert record.gdp_cents == 126000000000000
+    assert record.gdp_per_capita_cents() == 2495050
+    assert record.gdp_per_capita() == Decimal("24950.50")
+    assert GDPRecord(country="Tieland", year=2020, gdp_usd=Decimal("1.005"), population=1).gdp_cents is None
+
+
+def test_relay_and_average_are_memoised_until_cleared(sample_records):
+    analyzer = build_analyzer(sample_records)
+    target = Decimal("0.05")
+    assert analyzer.profit_relay_plan("Exampleland", target) == [(2021, Decimal("249.50"))]
+    cached = analyzer._relay_shortfalls("Exampleland", target, Decimal("0"))
+    assert analyzer._relay_shortfalls("Exampleland", target, Decimal("0")) is cached
+    assert analyzer.average_per_capita("Exampleland") == Decimal("25157.70")
+
+    analyzer.dataset = GDPPerCapitaDataset(sample_records[:2])
+    analyzer.clear_caches()
+    assert analyzer.average_per_capita("Exampleland") == Decimal("24475.25")
+    assert analyzer.profit_relay_total("Exampleland", target) == Decimal("249.50")
@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+import stat
+
+import pytest
+
+from src.storage import merkle_logger
+from src.storage.merkle_logger import MerkleLogger
+
+
+@pytest.mark.asyncio
+async def test_log_round_streams_archive_and_chains_root(tmp_path):
+    logger = MerkleLogger(str(tmp_path))
+    assert logger.get_current_root() == ""
+
+    results = [{"model": "m", "text": "x" * 200_000}]
+    first = await logger.log_round({"round": 1}, results)
+    archives = list(tmp_path.glob("*.json"))
+    assert len(archives) == 1
+    blob = archives[0].read_bytes()
+    digest = hashlib.sha256(blob).digest()
+    assert archives[0].stem == digest.hex()
+    assert json.loads(blob)["results"] == results
+    assert first == hashlib.sha256(digest).hexdigest()
+
+    second = await logger.log_round({"round": 2}, [])
+    assert second == logger.get_current_root()
+    assert second != first
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.asyncio
+async def test_prune_evicts_oldest_archives_without_rescanning(tmp_path, monkeypatch):
+    from config.settings import settings
+
+    monkeypatch.setattr(settings, "archive_cap", 2)
+    stale = tmp_path / "stale.json"
+    stale.write_text("{}")
+    logger = MerkleLogger(str(tmp_path))
+    await logger.log_round({"round": 1}, [])
+    kept = set(tmp_path.glob("*.json"))
+    assert stale in kept and len(kept) == 2
+
+    await logger.log_round({"round": 2}, [])
+    remaining = set(tmp_path.glob("*.json"))
+    assert stale not in remaining
+    assert len(remaining) == 2
+
+
+@pytest.mark.asyncio
+async def test_round_context_json_is_spliced_byte_for_byte(tmp_path):
+    from src.llm.orchestrator import RoundContext
+
+    context = RoundContext(
+        symbol="BTCUSDT",
+        price=100.5,
+        sol_tips_proxy=1.0,
+        sol_whales_proxy=2.0,
+        trending_source="test",
+        timestamp=0.0,
+        round_id="round_test",
+    )
+    results = [{"model": "m", "text": "ü", "success": True}]
+    await MerkleLogger(str(tmp_path)).log_round(context, results)
+    (archive,) = tmp_path.glob("*.json")
+    payload = json.loads(archive.read_bytes())
+    assert payload["context"] == context.__dict__
+    assert archive.read_bytes() == json.dumps(payload, sort_keys=True).encode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_archives_get_default_file_mode(tmp_path):
+    await MerkleLogger(str(tmp_path)).log_round({"round": 1}, [])
+    (archive,) = tmp_path.glob("*.json")
+    assert stat.S_IMODE(os.stat(archive).st_mode) == 0o666 & ~merkle_logger._UMASK
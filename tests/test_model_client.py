@@ -0,0 +1,20 @@
+import pytest
+
+from src.llm.model_client import ModelClient
+
+
+def test_update_latency_keeps_running_mean() -> None:
+    client = ModelClient("dummy", "http://localhost")
+    for latency in (10.0, 20.0, 60.0):
+        client.successful_calls += 1
+        client._update_latency(latency)
+    assert client.avg_latency == pytest.approx(30.0)
+
+
+def test_backoff_schedule_doubles_and_is_capped(monkeypatch) -> None:
+    from config.settings import settings
+
+    monkeypatch.setattr(settings, "retry_backoff", 1.5)
+    monkeypatch.setattr(settings, "max_retries", 5)
+    client = ModelClient("dummy", "http://localhost")
+    assert client._backoffs == [1.5, 3.0, 6.0, 10.0, 10.0]
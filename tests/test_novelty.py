@@ -1,4 +1,6 @@
+from src.metrics.impact_engine import ImpactEngine
 from src.metrics.novelty_engine import NoveltyEngine
+from src.metrics.tokens import lower_tokens
 
 
 def test_novelty_engine_scores_text() -> None:
@@ -6,3 +8,10 @@ def test_novelty_engine_scores_text() -> None:
     result = engine.score("This is a detailed experiment protocol with numerous specifics." * 5)
     assert 0.0 <= result.score <= 1.0
     assert result.rationale
+
+
+def test_engines_accept_precomputed_tokens() -> None:
+    text = "Backtest the deployment PROTOCOL " * 60
+    tokens = lower_tokens(text)
+    for engine in (NoveltyEngine(), ImpactEngine()):
+        assert engine.score(text, tokens) == engine.score(text)
@@ -1,11 +1,15 @@
+import io
+import math
 from pathlib import Path
 from typing import Dict, List
 
 import pytest
 
+from src.api import research_factory
 from src.api.research_factory import (
     ResearchFactory,
     fetch_recent_papers,
+    fetch_recent_papers_batch,
 )
 
 EXPECTED_REFERENCES = [
@@ -25,7 +29,13 @@ def _stub_references(query: str, max_items: int) -> List[Dict[str, str]]:
     return list(EXPECTED_REFERENCES)
 
 
-def test_research_factory_generates_real_metrics() -> None:
+@pytest.fixture
+def reference_cache_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr("src.api.research_factory.settings.data_root", str(tmp_path))
+    return tmp_path
+
+
+def test_research_factory_generates_real_metrics(reference_cache_root: Path) -> None:
     dataset_path = Path(__file__).resolve().parents[1] / "data" / "real_experiment.csv"
     factory = ResearchFactory(dataset_path=dataset_path, reference_fetcher=_stub_references)
 
@@ -46,17 +56,23 @@ def test_research_factory_generates_real_metrics() -> None:
     assert paper["references"] == EXPECTED_REFERENCES
 
 
-def test_fetch_recent_papers_deduplicates_and_orders(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_fetch_recent_papers_deduplicates_and_orders(
+    monkeypatch: pytest.MonkeyPatch, reference_cache_root: Path
+) -> None:
     class MockResponse:
         def __init__(self, *, ok: bool = True, json_data=None, text: str = "") -> None:
             self.ok = ok
             self._json = json_data or {}
             self.text = text
+            self.raw = io.BytesIO(text.encode("utf-8"))
 
         def json(self):
             return self._json
 
-    def fake_get(url: str, timeout: int):  # type: ignore[override]
+        def close(self) -> None:
+            return None
+
+    def fake_get(url: str, timeout: int, stream: bool = False):  # type: ignore[override]
         if "crossref" in url:
             return MockResponse(
                 json_data={
@@ -110,7 +126,9 @@ def test_fetch_recent_papers_deduplicates_and_orders(monkeypatch: pytest.MonkeyP
             }
         )
 
-    monkeypatch.setattr("src.api.research_factory.requests.get", fake_get)
+    monkeypatch.setattr(
+        "requests.Session.get", lambda session, url, **kwargs: fake_get(url, **kwargs)
+    )
 
     results = fetch_recent_papers("weight efficiency", max_items=3)
     assert len(results) == 3
@@ -119,3 +137,148 @@ def test_fetch_recent_papers_deduplicates_and_orders(monkeypatch: pytest.MonkeyP
     assert results[2]["provider"] == "Semantic Scholar"
     assert results[0]["authors"] == "Ada Lovelace"
     assert results[2]["authors"] == "Unique Author"
+
+
+def test_fetch_recent_papers_batch_fetches_each_query_once() -> None:
+    calls: List[str] = []
+
+    def fetcher(query: str, max_items: int) -> List[Dict[str, str]]:
+        calls.append(query)
+        return [{"title": query, "source_id": query}]
+
+    results = fetch_recent_papers_batch(["a", "b", "a"], max_items=2, fetcher=fetcher)
+
+    assert sorted(calls) == ["a", "b"]
+    assert list(results) == ["a", "b"]
+    assert results["b"] == [{"title": "b", "source_id": "b"}]
+
+
+def test_fetch_recent_papers_reuses_disk_cache(
+    monkeypatch: pytest.MonkeyPatch, reference_cache_root: Path
+) -> None:
+    calls: List[str] = []
+
+    def fake_fetch(query: str, max_items: int, timeout: int) -> List[Dict[str, str]]:
+        calls.append(query)
+        return list(EXPECTED_REFERENCES)
+
+    monkeypatch.setattr("src.api.research_factory._fetch_recent_papers_uncached", fake_fetch)
+
+    first = fetch_recent_papers("cached query", max_items=1)
+    second = fetch_recent_papers("cached query", max_items=1)
+
+    assert calls == ["cached query"]
+    assert first == second == EXPECTED_REFERENCES
+    assert list((reference_cache_root / "refs_cache").rglob("*.json"))
+
+
+def test_fetch_recent_papers_drops_previous_days(
+    monkeypatch: pytest.MonkeyPatch, reference_cache_root: Path
+) -> None:
+    monkeypatch.setattr(
+        "src.api.research_factory._fetch_recent_papers_uncached",
+        lambda query, max_items, timeout: list(EXPECTED_REFERENCES),
+    )
+    stale_day = reference_cache_root / "refs_cache" / "2000-01-01"
+    stale_day.mkdir(parents=True)
+    (stale_day / "old.json").write_text("[]")
+
+    fetch_recent_papers("fresh query", max_items=1)
+
+    day_dirs = list((reference_cache_root / "refs_cache").iterdir())
+    assert not stale_day.exists()
+    assert len(day_dirs) == 1 and list(day_dirs[0].glob("*.json"))
+
+
+def test_fetch_recent_papers_batch_collapses_equivalent_queries() -> None:
+    calls: List[str] = []
+
+    def fetcher(query: str, max_items: int) -> List[Dict[str, str]]:
+        calls.append(query)
+        return [{"title": query, "source_id": query}]
+
+    results = fetch_recent_papers_batch(
+        ["Weight of the vehicle", "vehicle weight", "Fuel efficiency"], fetcher=fetcher
+    )
+
+    assert sorted(calls) == ["Fuel efficiency", "Weight of the vehicle"]
+    assert results["vehicle weight"] == results["Weight of the vehicle"]
+
+
+def test_export_tab_renders_each_batch_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    rendered: List[int] = []
+    build_json_export = ResearchFactory.build_json_export
+
+    def counting_json_export(papers):
+        rendered.append(len(papers))
+        return build_json_export(papers)
+
+    monkeypatch.setattr(ResearchFactory, "build_json_export", staticmethod(counting_json_export))
+    monkeypatch.setattr(research_factory, "_export_cache", research_factory.OrderedDict())
+
+    class FakeStreamlit:
+        def __init__(self) -> None:
+            self.downloads: List[str] = []
+
+        def download_button(self, label, data, **kwargs):
+            self.downloads.append(data)
+
+        def code(self, body, language=None):
+            pass
+
+    papers = [
+        {"id": "p1", "created_at": "t0", "title": "T", "hypothesis": "H"},
+        {"id": "p2", "created_at": "t0", "title": "U", "hypothesis": "I"},
+    ]
+    st = FakeStreamlit()
+    research_factory.render_export_tab(papers, st_module=st)
+    research_factory.render_export_tab(list(papers), st_module=st)
+    assert rendered == [2]
+    assert st.downloads[:2] == st.downloads[2:]
+
+    research_factory.render_export_tab([dict(papers[0], created_at="t1")], st_module=st)
+    assert rendered == [2, 1]
+
+
+def test_markdown_export_tolerates_missing_metrics() -> None:
+    markdown = ResearchFactory.build_markdown_export(
+        [{"title": "Partial", "hypothesis": "H", "metrics": {"effect_size": -1.5}}]
+    )
+
+    assert markdown.startswith("## Partial\n\n**Hypothesis:** H")
+    assert "- Effect size: -1.500000" in markdown
+    assert "- p-value: nan" in markdown
+
+
+def test_regression_summary_persists_across_restarts(
+    monkeypatch: pytest.MonkeyPatch, reference_cache_root: Path
+) -> None:
+    dataset_path = Path(__file__).resolve().parents[1] / "data" / "real_experiment.csv"
+    research_factory._fit_regression.cache_clear()
+    baseline = ResearchFactory(dataset_path=dataset_path)._run_regression()
+    assert list((reference_cache_root / "reg_cache").glob("*.json"))
+
+    def fail_refit(*args):
+        raise AssertionError("regression should be served from the disk cache")
+
+    research_factory._fit_regression.cache_clear()
+    monkeypatch.setattr(research_factory, "_compute_regression", fail_refit)
+    assert ResearchFactory(dataset_path=dataset_path)._run_regression() == baseline
+    research_factory._fit_regression.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("rows", "mean_mpg"),
+    [("3.0,20.0\n3.0,22.0\n3.0,24.0\n", 22.0), ("2.0,20.0\n3.0,22.0\n", 21.0)],
+)
+def test_degenerate_regression_reports_nan(tmp_path: Path, rows: str, mean_mpg: float) -> None:
+    dataset_path = tmp_path / "degenerate.csv"
+    dataset_path.write_text("wt,mpg\n" + rows)
+    summary = research_factory._compute_regression(
+        *research_factory._dataset_key(dataset_path)
+    )
+
+    assert math.isnan(summary.effect_size)
+    assert math.isnan(summary.p_value)
+    assert math.isnan(summary.r_squared)
+    assert summary.intercept == pytest.approx(mean_mpg)
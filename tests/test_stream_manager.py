@@ -0,0 +1,166 @@
+import asyncio
+import sys
+from collections import deque
+
+import pytest
+from websockets.exceptions import ConnectionClosedOK
+
+from src.streams import stream_manager
+from src.streams.stream_manager import CircuitBreaker, StreamManager
+
+
+class FakeSocket:
+    def __init__(self, messages):
+        self.messages = deque(messages)
+        self.closed = False
+        self.recv_waits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    async def recv(self):
+        if not self.messages or self.closed:
+            self.recv_waits += 1
+            await asyncio.sleep(0)
+        if self.closed or not self.messages:
+            raise ConnectionClosedOK(None, None)
+        return self.messages.popleft()
+
+    async def close(self, code=1000):
+        self.closed = True
+
+
+class SilentSocket(FakeSocket):
+    def __init__(self):
+        super().__init__([])
+        self._closed_event = asyncio.Event()
+
+    async def recv(self):
+        await self._closed_event.wait()
+        raise ConnectionClosedOK(None, None)
+
+    async def close(self, code=1000):
+        self.closed = True
+        self._closed_event.set()
+
+
+@pytest.mark.asyncio
+async def test_stream_hands_frames_to_handler_in_order(monkeypatch):
+    sockets = [FakeSocket(["a", "boom", "c"]), FakeSocket(["d", "e"])]
+    options = []
+
+    def fake_connect(url, **kwargs):
+        options.append(kwargs)
+        return sockets.pop(0)
+
+    monkeypatch.setattr(stream_manager, "connect", fake_connect)
+    manager = StreamManager()
+    manager.start()
+    seen = []
+
+    async def handler(message):
+        if message == "boom":
+            raise ValueError(message)
+        seen.append(message)
+        if message == "e":
+            manager.stop()
+
+    await asyncio.wait_for(manager.managed_websocket_stream("ws://test", handler), timeout=5)
+    assert seen == ["a", "d", "e"]
+    assert all(kwargs["compression"] is None for kwargs in options)
+    assert all(kwargs["write_limit"] == 2**20 for kwargs in options)
+    assert all("ssl" not in kwargs for kwargs in options)
+    metrics = manager.get_health_metrics()
+    assert metrics["reconnect_count"] == 2
+    assert metrics["error_count"] == 1
+    assert metrics["circuit_breaker_state"] == "CLOSED"
+
+
+def test_install_uvloop_is_optional(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    assert StreamManager.install_uvloop() is False
+
+
+def test_circuit_breaker_opens_then_half_opens(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(stream_manager.time, "monotonic", lambda: clock[0])
+    breaker = CircuitBreaker(max_failures=2, timeout=10)
+    breaker.on_failure()
+    assert breaker.can_execute() and breaker.state == "CLOSED"
+    breaker.on_failure()
+    assert breaker.state == "OPEN" and not breaker.can_execute()
+    clock[0] += 10
+    assert breaker.can_execute() and breaker.state == "HALF_OPEN"
+    breaker.on_success()
+    assert breaker.state == "CLOSED" and breaker.failures == 0
+
+
+def test_health_metrics_reuse_snapshot_until_state_changes():
+    manager = StreamManager()
+    first = manager.get_health_metrics()
+    manager.health.message_count = 7
+    assert manager.get_health_metrics() is first
+    manager.circuit_breaker.max_failures = 1
+    manager.circuit_breaker.on_failure()
+    refreshed = manager.get_health_metrics()
+    assert refreshed["message_count"] == 7
+    assert refreshed["circuit_breaker_state"] == "OPEN"
+
+
+def test_downtime_accrues_per_sample_not_per_scrape():
+    manager = StreamManager()
+    manager.health.last_message = 1000.0
+    for tick in range(1, 36):
+        manager._sample_downtime(1000.0 + tick, 1.0)
+    assert manager.health.total_downtime == pytest.approx(5.0)
+    manager.metrics_ttl_seconds = 0.0
+    manager.get_health_metrics()
+    manager.get_health_metrics()
+    assert manager.health.total_downtime == pytest.approx(5.0)
+
+
+@pytest.mark.asyncio
+async def test_drain_ready_batches_buffered_frames():
+    socket = FakeSocket([str(i) for i in range(40)])
+    assert await StreamManager._drain_ready(socket) == [str(i) for i in range(32)]
+    assert await StreamManager._drain_ready(socket) == [str(i) for i in range(32, 40)]
+    assert socket.recv_waits == 0
+
+
+@pytest.mark.asyncio
+async def test_stop_closes_a_silent_connection(monkeypatch):
+    socket = SilentSocket()
+    monkeypatch.setattr(stream_manager, "connect", lambda url, **kwargs: socket)
+    manager = StreamManager()
+    manager.start()
+
+    async def handler(message):
+        raise AssertionError("no frames expected")
+
+    stream = asyncio.create_task(manager.managed_websocket_stream("ws://test", handler))
+    while manager._ws is None:
+        await asyncio.sleep(0)
+    manager.stop()
+    await asyncio.wait_for(stream, timeout=1)
+    assert socket.closed
+
+
+def test_circuit_breaker_state_can_be_assigned(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(stream_manager.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(stream_manager.time, "time", lambda: clock[0] + 5000.0)
+    breaker = CircuitBreaker(max_failures=5, timeout=10)
+    breaker.on_failure()
+    assert breaker.last_failure == 5100.0
+    clock[0] += 4
+    breaker.state = "OPEN"
+    assert not breaker.can_execute()
+    clock[0] += 6
+    assert breaker.can_execute() and breaker.state == "HALF_OPEN"
+    breaker.state = "CLOSED"
+    assert breaker.can_execute() and breaker.state == "CLOSED"
+    with pytest.raises(ValueError):
+        breaker.state = "AJAR"
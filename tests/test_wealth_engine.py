@@ -1,4 +1,5 @@
-import asyncio
+from datetime import datetime
+from decimal import Decimal
 import random
 
 import pytest
@@ -7,6 +8,9 @@ from src.kpi_engine.economic_singularity import (
     EconomicSingularity,
     FreeTierOrchestrator,
     GDPImpactTracker,
+    GDPOptimizationRouter,
+    PromptEconomicProfile,
+    WealthCompoundingEngine,
     ZeroBudgetWealthEngine,
 )
 
@@ -17,7 +21,7 @@ async def test_process_economic_idea_is_deterministic():
     result = await singularity.process_economic_idea(
         "Automated business process optimization system"
     )
-    assert result["prompt_asset"]["id"] == "9c0eb3ec11405fa7"
+    assert result["prompt_asset"]["id"] == "9595ffa868c10e17"
     assert result["deployment_url"].startswith("https://")
     assert result["deployment_number"] == 1
     assert result["intellectual_wealth"] > 0
@@ -56,3 +60,220 @@ async def test_mass_deploy_round_robin():
         "https://economic-engine.github.io/"
     )
 
+
+def test_calculate_gdp_impact_batch_matches_scalar():
+    engine = ZeroBudgetWealthEngine(rng=random.Random(0))
+    prompt_types = ["code_infrastructure", "scientific_research", "code_infrastructure"]
+    batch = engine.calculate_gdp_impact_batch(prompt_types, [10, 5, 0])
+    for index, (prompt_type, runs) in enumerate(zip(prompt_types, [10, 5, 0])):
+        scalar = engine.calculate_gdp_impact(prompt_type, executions=runs)
+        assert batch["gdp_impact"][index] == pytest.approx(scalar["gdp_impact"])
+        assert batch["total_cost"][index] == pytest.approx(scalar["total_cost"])
+    assert batch["effective_roi"][2] == float("inf")
+
+
+def test_tracker_cumulative_impact_accumulates():
+    tracker = GDPImpactTracker()
+    tracker.record_impact({"id": "a"}, {"gdp_impact": 1000.0})
+    record = tracker.record_impact({"id": "b"}, {"gdp_impact": 500.0}, precise=True)
+    assert record["verified_impact"] == pytest.approx(400.0)
+    assert record["cumulative_verified_impact"] == pytest.approx(1200.0)
+
+
+def test_router_follows_profile_changes():
+    engine = ZeroBudgetWealthEngine(rng=random.Random(0))
+    router = GDPOptimizationRouter(engine)
+    assert router.route_prompt("anything") == "scientific_research"
+    del engine.prompt_economics["scientific_research"]
+    assert router.route_prompt("anything") == "financial_modeling"
+    router.invalidate_cache()
+    assert router.route_prompt("anything") == "financial_modeling"
+
+
+@pytest.mark.asyncio
+async def test_profiles_added_and_removed_after_construction_are_routed():
+    singularity = EconomicSingularity(rng=random.Random(1))
+    profiles = singularity.wealth_engine.prompt_economics
+    profiles["moonshot"] = PromptEconomicProfile("moonshot", 100, 0.001, 50000.0, 5e7)
+    result = await singularity.process_economic_idea("research platform")
+    assert result["economic_impact"]["prompt_type"] == "moonshot"
+    assert result["economic_impact"]["gdp_impact"] == pytest.approx(4500000.0)
+
+    del profiles["moonshot"]
+    result = await singularity.process_economic_idea("research platform")
+    assert result["economic_impact"]["prompt_type"] == "scientific_research"
+
+
+@pytest.mark.asyncio
+async def test_process_economic_ideas_matches_sequential():
+    ideas = ["research platform", "financial dashboard", "plain idea"]
+    sequential = EconomicSingularity(rng=random.Random(7))
+    expected = [await sequential.process_economic_idea(idea) for idea in ideas]
+    batched = EconomicSingularity(rng=random.Random(7))
+    results = await batched.process_economic_ideas(ideas)
+    assert [r["deployment_url"] for r in results] == [e["deployment_url"] for e in expected]
+    assert [r["deployment_number"] for r in results] == [1, 2, 3]
+    for result, reference in zip(results, expected):
+        assert result["prompt_asset"] == reference["prompt_asset"]
+        assert result["intellectual_wealth"] == pytest.approx(reference["intellectual_wealth"])
+        assert result["cumulative_gdp_impact"] == pytest.approx(
+            reference["cumulative_gdp_impact"]
+        )
+
+
+def test_compounding_high_precision_keeps_decimal():
+    fast = WealthCompoundingEngine().compound_wealth(1000.0, periods=2)
+    exact = WealthCompoundingEngine(high_precision=True).compound_wealth(Decimal("1000"), periods=2)
+    assert isinstance(fast, float)
+    assert exact == Decimal("1322.5000")
+    assert fast == pytest.approx(float(exact))
+
+
+def test_tracker_records_view_matches_returned_rows():
+    tracker = GDPImpactTracker()
+    rows = [tracker.record_impact({"id": f"a{i}"}, {"gdp_impact": 100.0 * i}) for i in range(3)]
+    assert list(tracker.records()) == rows
+    assert tracker.impact_ledger == rows
+    assert tracker.get_economic_dashboard()["total_verified_impact_usd"] == pytest.approx(240.0)
+
+
+def test_track_diffusion_impact_float_and_precise_agree():
+    asset = {"estimated_value_usd": 1000.0}
+    fast = WealthCompoundingEngine().track_diffusion_impact(asset, adoptions=5)
+    exact = WealthCompoundingEngine(high_precision=True).track_diffusion_impact(asset, adoptions=5)
+    assert fast == pytest.approx(450.0)
+    assert exact == Decimal("450.0")
+
+
+@pytest.mark.asyncio
+async def test_deploy_many_is_reproducible_for_seeded_engines():
+    assets = [{"id": f"asset{i}"} for i in range(20)]
+    first = await ZeroBudgetWealthEngine(rng=random.Random(3)).deploy_many(assets)
+    second = await ZeroBudgetWealthEngine(rng=random.Random(3)).deploy_many(assets)
+    assert first == second
+    assert all(url.endswith(f"/asset{i}") for i, url in enumerate(first))
+
+
+def test_network_and_diffusion_batches_match_scalar():
+    engine = WealthCompoundingEngine()
+    counts = [0, 3, 12]
+    assert engine.network_effect_batch(counts).tolist() == [
+        engine.calculate_network_effect(count) for count in counts
+    ]
+    diffusion = engine.diffusion_batch([1000.0, 250.0], [5, 0])
+    assert diffusion.tolist() == pytest.approx(
+        [
+            engine.track_diffusion_impact({"estimated_value_usd": 1000.0}, 5),
+            engine.track_diffusion_impact({"estimated_value_usd": 250.0}, 0),
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_mass_deploy_falls_back_for_unknown_provider():
+    orchestrator = FreeTierOrchestrator()
+    orchestrator.providers = ["vercel", "unknown"]
+    urls = await orchestrator.mass_deploy({"id": f"a{i}"} for i in range(3))
+    assert urls == [
+        "https://a0.vercel.app",
+        "https://github.com/backup/a1",
+        "https://a2.vercel.app",
+    ]
+
+
+def test_compound_wealth_batch_matches_scalar():
+    engine = WealthCompoundingEngine()
+    batch = engine.compound_wealth_batch([100.0, 2500.0], periods=12)
+    assert batch.tolist() == [
+        engine.compound_wealth(100.0, periods=12),
+        engine.compound_wealth(2500.0, periods=12),
+    ]
+
+
+def test_calculate_gdp_impact_returns_independent_copies():
+    engine = ZeroBudgetWealthEngine(rng=random.Random(0))
+    first = engine.calculate_gdp_impact("code_infrastructure", executions=100)
+    first["gdp_impact"] = -1.0
+    second = engine.calculate_gdp_impact("code_infrastructure", executions=100)
+    assert second["gdp_impact"] == pytest.approx(90000.0)
+
+
+def test_calculate_gdp_impact_all_covers_every_prompt_type():
+    engine = ZeroBudgetWealthEngine(rng=random.Random(0))
+    reports = engine.calculate_gdp_impact_all(executions=10)
+    assert set(reports) == set(engine.prompt_economics)
+    for prompt_type, report in reports.items():
+        assert report == pytest.approx(engine.calculate_gdp_impact(prompt_type, executions=10))
+
+
+def test_batch_scoring_reindexes_after_profile_changes():
+    engine = ZeroBudgetWealthEngine(rng=random.Random(0))
+    engine.prompt_economics["custom"] = PromptEconomicProfile("custom", 100, 0.001, 100.0, 100000.0)
+    batch = engine.calculate_gdp_impact_batch(["custom"], [10])
+    assert batch["gdp_impact"][0] == pytest.approx(900.0)
+    del engine.prompt_economics["code_infrastructure"]
+    assert "code_infrastructure" not in engine.calculate_gdp_impact_all(executions=1)
+
+
+def test_impact_cache_is_dropped_when_a_profile_is_replaced():
+    engine = ZeroBudgetWealthEngine(rng=random.Random(0))
+    assert engine.calculate_gdp_impact("code_infrastructure", 10)["gdp_impact"] == pytest.approx(9000.0)
+    engine.prompt_economics["code_infrastructure"] = PromptEconomicProfile(
+        "code_infrastructure", 500, 0.002, 2000.0, 1000000.0
+    )
+    assert engine.calculate_gdp_impact("code_infrastructure", 10)["gdp_impact"] == pytest.approx(18000.0)
+
+
+def test_impact_ledger_is_a_read_only_view():
+    tracker = GDPImpactTracker()
+    tracker.record_impact({"id": "a"}, {"gdp_impact": 100.0})
+    tracker.record_impact({"id": "b"}, {"gdp_impact": 50.0})
+    ledger = tracker.impact_ledger
+    assert len(ledger) == 2
+    assert [row["cumulative_verified_impact"] for row in ledger[:]] == pytest.approx(
+        [80.0, 120.0]
+    )
+    assert list(tracker.records()) == list(ledger)
+    with pytest.raises(AttributeError):
+        ledger.append({"asset_id": "manual", "verified_impact": 20.0})
+    with pytest.raises(TypeError):
+        del ledger[0]
+    with pytest.raises(TypeError):
+        ledger[0] = {"asset_id": "manual", "verified_impact": 20.0}
+    assert tracker.get_economic_dashboard()["total_verified_impact_usd"] == pytest.approx(120.0)
+
+
+def test_recorded_rows_build_timestamps_lazily():
+    tracker = GDPImpactTracker()
+    row = tracker.record_impact({"id": "a"}, {"gdp_impact": 10.0})
+    assert isinstance(row["timestamp"], datetime)
+    assert dict(row)["asset_id"] == "a"
+    with pytest.raises(KeyError):
+        row["missing"]
+
+
+@pytest.mark.asyncio
+async def test_mass_deploy_without_providers_uses_backup_urls():
+    orchestrator = FreeTierOrchestrator()
+    orchestrator.providers = []
+    urls = await orchestrator.mass_deploy([{"id": "a0"}, {"id": "a1"}])
+    assert urls == ["https://github.com/backup/a0", "https://github.com/backup/a1"]
+
+
+@pytest.mark.asyncio
+async def test_failed_pricing_skips_deployment(monkeypatch):
+    singularity = EconomicSingularity(rng=random.Random(0))
+    deployed = []
+
+    def broken_route(self, idea, context=None):
+        raise RuntimeError("pricing failed")
+
+    async def record_deploy(self, prompt_asset):
+        deployed.append(prompt_asset)
+        return "https://example.invalid/"
+
+    monkeypatch.setattr(GDPOptimizationRouter, "route_prompt", broken_route)
+    monkeypatch.setattr(ZeroBudgetWealthEngine, "deploy_to_free_tier", record_deploy)
+    with pytest.raises(RuntimeError):
+        await singularity.process_economic_idea("research platform")
+    assert deployed == []